@@ -3,6 +3,7 @@
 Integration tests for kJSON PostgreSQL extension
 """
 
+import io
 import os
 import json
 import uuid
@@ -14,6 +15,45 @@ import pytest
 from psycopg2.extensions import register_adapter, AsIs
 
 
+def _copy_escape(text):
+    """Escape a value for PostgreSQL COPY text format"""
+    return (text.replace('\\', '\\\\')
+                .replace('\t', '\\t')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r'))
+
+
+def _bulk_load_kjson(cursor, table, rows):
+    """Load kjson literals into table's data column with a single COPY"""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write(_copy_escape(row))
+        buf.write('\n')
+    buf.seek(0)
+    cursor.copy_expert(f"COPY {table} (data) FROM STDIN (FORMAT text)", buf)
+
+
+def _insert_many(cursor, table, rows, page_size=1000):
+    """Insert kjson literals into table's data column in batched statements"""
+    psycopg2.extras.execute_values(
+        cursor,
+        f"INSERT INTO {table} (data) VALUES %s",
+        [(row,) for row in rows],
+        template='(%s::kjson)',
+        page_size=page_size
+    )
+
+
+def _perf_rows(count):
+    """Generate single-line kjson records with extended types for load tests"""
+    price_step = decimal.Decimal('0.99')
+    for n in range(1, count + 1):
+        yield (
+            f'{{"id": {n}n, "name": "Item {n}", "price": {n * price_step}m, '
+            f'"created": 2025-01-10T12:00:00Z, "tags": ["tag1", "tag2", "tag3"]}}'
+        )
+
+
 class TestKJsonExtension:
     """Test suite for kJSON PostgreSQL extension"""
     
@@ -51,10 +91,15 @@ class TestKJsonExtension:
             ('{}', '{}'),
         ]
         
-        for input_val, expected in test_cases:
-            cursor.execute(f"SELECT '{input_val}'::kjson")
-            result = cursor.fetchone()[0]
-            assert result == expected, f"Expected {expected}, got {result}"
+        # Parse and plan once, then execute per literal
+        cursor.execute("PREPARE basic_types (text) AS SELECT $1::kjson")
+        try:
+            for input_val, expected in test_cases:
+                cursor.execute("EXECUTE basic_types (%s)", (input_val,))
+                result = cursor.fetchone()[0]
+                assert result == expected, f"Expected {expected}, got {result}"
+        finally:
+            cursor.execute("DEALLOCATE basic_types")
     
     def test_extended_types(self, cursor):
         """Test extended kJSON types"""
@@ -110,11 +155,10 @@ class TestKJsonExtension:
             )
         """)
         
-        cursor.execute("""
-            INSERT INTO test_ops (data) VALUES
-            ('{"name": "Alice", "age": 30}'::kjson),
-            ('{"scores": [85, 92, 78]}'::kjson)
-        """)
+        _insert_many(cursor, 'test_ops', [
+            '{"name": "Alice", "age": 30}',
+            '{"scores": [85, 92, 78]}',
+        ])
         
         # Test -> operator
         cursor.execute("SELECT data->'name' FROM test_ops WHERE data->'name' IS NOT NULL")
@@ -179,25 +223,26 @@ class TestKJsonExtension:
             "created": 2025-01-10T12:00:00Z
         }"""
         
-        # Extract UUID
-        cursor.execute(f"SELECT kjson_extract_uuid('{test_data}'::kjson, 'id')")
-        result = cursor.fetchone()[0]
-        assert isinstance(result, uuid.UUID)
-        assert str(result) == '550e8400-e29b-41d4-a716-446655440000'
+        # Extract every field in a single round-trip
+        cursor.execute("""
+            SELECT kjson_extract_uuid(d, 'id'),
+                   kjson_extract_numeric(d, 'amount'),
+                   kjson_extract_numeric(d, 'price'),
+                   kjson_extract_timestamp(d, 'created')
+            FROM (SELECT %s::kjson AS d) t
+        """, (test_data,))
+        id_val, amount, price, created = cursor.fetchone()
         
-        # Extract numeric
-        cursor.execute(f"SELECT kjson_extract_numeric('{test_data}'::kjson, 'amount')")
-        result = cursor.fetchone()[0]
-        assert isinstance(result, decimal.Decimal)
+        # UUID
+        assert isinstance(id_val, uuid.UUID)
+        assert str(id_val) == '550e8400-e29b-41d4-a716-446655440000'
         
-        cursor.execute(f"SELECT kjson_extract_numeric('{test_data}'::kjson, 'price')")
-        result = cursor.fetchone()[0]
-        assert result == decimal.Decimal('99.99')
+        # Numeric
+        assert isinstance(amount, decimal.Decimal)
+        assert price == decimal.Decimal('99.99')
         
-        # Extract timestamp
-        cursor.execute(f"SELECT kjson_extract_timestamp('{test_data}'::kjson, 'created')")
-        result = cursor.fetchone()[0]
-        assert isinstance(result, datetime.datetime)
+        # Timestamp
+        assert isinstance(created, datetime.datetime)
     
     def test_aggregate_functions(self, cursor):
         """Test aggregate functions"""
@@ -218,8 +263,25 @@ class TestKJsonExtension:
         """)
         result = cursor.fetchone()[0]
         assert 'a' in result and 'b' in result
+        
+        # Aggregate 10000 objects sent as one VALUES list in a single round-trip
+        # (kjson output leaves identifier keys unquoted, so check it in SQL)
+        rows = psycopg2.extras.execute_values(
+            cursor,
+            """
+            SELECT kjson_array_length(agg),
+                   (SELECT count(DISTINCT (e->>'i')::int) FROM kjson_array_elements(agg) e),
+                   (SELECT sum((e->>'i')::int) FROM kjson_array_elements(agg) e)
+            FROM (SELECT kjson_agg(v) AS agg FROM (VALUES %s) t(v)) s
+            """,
+            [(f'{{"i": {i}}}',) for i in range(10000)],
+            template='(%s::kjson)',
+            page_size=10000,
+            fetch=True
+        )
+        assert rows[0] == (10000, 10000, sum(range(10000)))
     
-    def test_performance(self, cursor):
+    def test_performance(self, db_connection, cursor):
         """Test performance with larger datasets"""
         # Create table with many rows
         cursor.execute("""
@@ -229,18 +291,11 @@ class TestKJsonExtension:
             )
         """)
         
-        # Insert 1000 rows
-        cursor.execute("""
-            INSERT INTO perf_test (data)
-            SELECT ('{
-                "id": ' || n || 'n,
-                "name": "Item ' || n || '",
-                "price": ' || (n * 0.99) || 'm,
-                "created": 2025-01-10T12:00:00Z,
-                "tags": ["tag1", "tag2", "tag3"]
-            }')::kjson
-            FROM generate_series(1, 1000) n
-        """)
+        # Bulk load 10000 rows generated client-side
+        _bulk_load_kjson(cursor, 'perf_test', _perf_rows(10000))
+        
+        cursor.execute("SELECT COUNT(*) FROM perf_test")
+        assert cursor.fetchone()[0] == 10000
         
         # Test query performance
         cursor.execute("""
@@ -254,6 +309,17 @@ class TestKJsonExtension:
         assert count > 0
         assert ids is not None
         
+        # Stream every row through a server-side cursor in batches; WITH HOLD
+        # lets the named cursor live outside a transaction in autocommit mode
+        with db_connection.cursor(name='perf_iter', withhold=True) as iter_cursor:
+            iter_cursor.itersize = 500
+            iter_cursor.execute("SELECT data->'id' FROM perf_test")
+            walked = 0
+            for (row_id,) in iter_cursor:
+                assert row_id.endswith('n')
+                walked += 1
+        assert walked == 10000
+        
         cursor.execute("DROP TABLE perf_test")
     
     def test_error_handling(self, cursor):
@@ -1,12 +1,15 @@
 """kJSON (Kind JSON) - Extended JSON with BigInt, Decimal128, UUID, Instant, and Duration support."""
 
-from .api import dumps, loads, JSONDecodeError, JSONEncoder, JSONDecoder
-from .types import BigInt, Decimal128, Instant, Duration, Date, uuid_v4, uuid_v7
+from .api import dumps, loads, loads_many, dumpb, loadb, JSONDecodeError, JSONEncoder, JSONDecoder
+from .types import BigInt, Decimal128, Instant, Duration, Date, uuid_v4, uuid_v7, uuid_v7_batch
 
 __version__ = "0.1.0"
 __all__ = [
     "loads",
+    "loads_many",
     "dumps",
+    "loadb",
+    "dumpb",
     "JSONDecodeError",
     "JSONEncoder",
     "JSONDecoder",
@@ -17,4 +20,5 @@ __all__ = [
     "Date",
     "uuid_v4",
     "uuid_v7",
+    "uuid_v7_batch",
 ]
\ No newline at end of file
@@ -1,8 +1,8 @@
 """Main API functions for kJSON."""
 
-from typing import Any, Optional, Union, Type
+from typing import Any, Iterable, List, Optional, Union, Type
 from .parser import parse, JSONDecodeError as _JSONDecodeError
-from .serializer import dumps as _dumps
+from .serializer import dumps as _dumps, dumps_iter as _dumps_iter
 
 
 # Re-export JSONDecodeError
@@ -12,6 +12,11 @@ JSONDecodeError = _JSONDecodeError
 class JSONEncoder:
     """kJSON encoder class (for compatibility with json module)."""
     
+    __slots__ = (
+        'skipkeys', 'ensure_ascii', 'check_circular', 'allow_nan', 'sort_keys',
+        'indent', 'separators', 'default',
+    )
+    
     def __init__(
         self,
         *,
@@ -49,13 +54,27 @@ class JSONEncoder:
         )
     
     def iterencode(self, obj: Any, _one_shot: bool = False):
-        """Encode object to kJSON string iteratively (yields single string for compatibility)."""
-        yield self.encode(obj)
+        """Encode object to kJSON string iteratively, yielding it in chunks."""
+        if _one_shot:
+            yield self.encode(obj)
+        else:
+            yield from _dumps_iter(
+                obj,
+                ensure_ascii=self.ensure_ascii,
+                indent=self.indent,
+                default=self.default,
+                sort_keys=self.sort_keys
+            )
 
 
 class JSONDecoder:
     """kJSON decoder class (for compatibility with json module)."""
     
+    __slots__ = (
+        'object_hook', 'parse_float', 'parse_int', 'parse_constant', 'strict',
+        'object_pairs_hook',
+    )
+    
     def __init__(
         self,
         *,
@@ -76,25 +95,8 @@ class JSONDecoder:
     
     def decode(self, s: str) -> Any:
         """Decode kJSON string."""
-        result = parse(s)
-        
-        # Apply hooks if provided
-        if self.object_hook is not None:
-            result = self._apply_object_hook(result)
-        
-        return result
-    
-    def _apply_object_hook(self, obj: Any) -> Any:
-        """Apply object hook recursively."""
-        if isinstance(obj, dict):
-            # Apply to nested objects first
-            obj = {k: self._apply_object_hook(v) for k, v in obj.items()}
-            # Then apply hook to this object
-            return self.object_hook(obj)
-        elif isinstance(obj, list):
-            return [self._apply_object_hook(item) for item in obj]
-        else:
-            return obj
+        # The parser applies the object hook as each object is built
+        return parse(s, object_hook=self.object_hook)
 
 
 def loads(
@@ -106,6 +108,7 @@ def loads(
     parse_int: Optional[callable] = None,
     parse_constant: Optional[callable] = None,
     object_pairs_hook: Optional[callable] = None,
+    _parse=parse,
     **kw
 ) -> Any:
     """Deserialize kJSON text to a Python object.
@@ -123,6 +126,12 @@ def loads(
     Returns:
         Python object
     """
+    # Fast path: nothing for a decoder instance to do, parse directly
+    # (_parse is bound as a default argument so this is a local lookup)
+    if (cls is None and object_hook is None and parse_float is None and
+            parse_int is None and parse_constant is None and object_pairs_hook is None):
+        return _parse(s)
+    
     if cls is None:
         decoder = JSONDecoder(
             object_hook=object_hook,
@@ -143,6 +152,51 @@ def loads(
     return decoder.decode(s)
 
 
+def loads_many(
+    documents: Iterable[str],
+    *,
+    cls: Optional[Type[JSONDecoder]] = None,
+    object_hook: Optional[callable] = None,
+    parse_float: Optional[callable] = None,
+    parse_int: Optional[callable] = None,
+    parse_constant: Optional[callable] = None,
+    object_pairs_hook: Optional[callable] = None,
+    _parse=parse,
+    **kw
+) -> List[Any]:
+    """Deserialize a batch of kJSON texts, such as the lines of an NDJSON stream.
+    
+    Equivalent to calling loads() on each document with the same options,
+    but the decoder is set up once for the whole batch.
+    
+    Args:
+        documents: Iterable of kJSON texts, one document each
+        cls: Custom decoder class
+        object_hook: Function called with dict objects
+        parse_float: Function to parse floats (ignored - kJSON handles extended types)
+        parse_int: Function to parse integers (ignored - kJSON handles BigInt)
+        parse_constant: Function to parse constants (ignored)
+        object_pairs_hook: Function called with object pairs (ignored)
+        **kw: Additional keyword arguments (ignored)
+    
+    Returns:
+        List of Python objects, in document order
+    """
+    if (cls is None and object_hook is None and parse_float is None and
+            parse_int is None and parse_constant is None and object_pairs_hook is None):
+        return [_parse(s) for s in documents]
+    
+    decoder = (JSONDecoder if cls is None else cls)(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        object_pairs_hook=object_pairs_hook
+    )
+    decode = decoder.decode
+    return [decode(s) for s in documents]
+
+
 def dumps(
     obj: Any,
     *,
@@ -155,6 +209,7 @@ def dumps(
     separators: Optional[tuple] = None,
     default: Optional[callable] = None,
     sort_keys: bool = False,
+    _default_encode=_dumps,
     **kw
 ) -> str:
     """Serialize obj to a kJSON formatted string.
@@ -175,6 +230,13 @@ def dumps(
     Returns:
         kJSON formatted string
     """
+    # Fast path: default options go straight to the serializer (bound as a
+    # default argument so this is a local lookup)
+    if (cls is None and not skipkeys and not ensure_ascii and check_circular and
+            allow_nan and indent is None and separators is None and default is None and
+            not sort_keys):
+        return _default_encode(obj)
+    
     if cls is None:
         return _dumps(
             obj,
@@ -198,4 +260,40 @@ def dumps(
             separators=separators,
             default=default
         )
-        return encoder.encode(obj)
\ No newline at end of file
+        return encoder.encode(obj)
+
+
+def loadb(
+    b: Union[bytes, bytearray, memoryview],
+    **kw
+) -> Any:
+    """Deserialize UTF-8 encoded kJSON bytes to a Python object.
+    
+    Args:
+        b: UTF-8 encoded kJSON text
+        **kw: Keyword arguments accepted by loads()
+    
+    Returns:
+        Python object
+    """
+    # The codec validates while decoding, so the parser never rescans for it;
+    # invalid input is reported like any other decode error
+    try:
+        s = str(b, 'utf-8')
+    except UnicodeDecodeError as e:
+        valid = str(b[:e.start], 'utf-8')
+        raise JSONDecodeError("Invalid UTF-8", valid, len(valid)) from None
+    return loads(s, **kw)
+
+
+def dumpb(obj: Any, **kw) -> bytes:
+    """Serialize obj to UTF-8 encoded kJSON bytes.
+    
+    Args:
+        obj: Object to serialize
+        **kw: Keyword arguments accepted by dumps()
+    
+    Returns:
+        UTF-8 encoded kJSON text
+    """
+    return dumps(obj, **kw).encode('utf-8')
@@ -2,10 +2,55 @@
 
 import re
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from .types import BigInt, Decimal128, Date
 
 
+# Matcher for a run of insignificant whitespace and comments. Block comments
+# are scanned in unrolled form (runs of non-'*' characters, then stars) rather
+# than with a lazy '.*?', which retries the terminator at every character. An
+# unterminated block comment stops short of the last character so the caller
+# rejects it there (or runs to the end when opened right at the end of the text)
+_INSIGNIFICANT = re.compile(
+    r'(?:[ \t\n\r]+|//[^\n]*|/\*(?:[^*]*\*+(?:[^/*][^*]*\*+)*/|.*(?=.)|.*))*', re.DOTALL
+).match
+
+# Single-character escape sequences and the characters they stand for
+_SIMPLE_ESCAPES = {
+    '"': '"', "'": "'", '`': '`', '\\': '\\', '/': '/',
+    'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t',
+}
+
+# Canonical string per object key, so repeated keys share one object across
+# objects and documents; only short keys are kept, and it is cleared when full
+_KEY_CACHE: Dict[str, str] = {}
+_KEY_CACHE_SIZE = 1024
+_KEY_CACHE_MAX_LENGTH = 32
+
+# Matcher for the start of a UUID (8 hex digits and a dash) or a date (YYYY-)
+_LITERAL_PREFIX = re.compile(r'[0-9a-fA-F]{8}-|[0-9]{4}-').match
+
+# Matchers for the characters after the first in an unquoted key (\w covers
+# the same alphanumerics as str.isalnum(), plus '_'), and for a whole unquoted
+# key starting with an ASCII letter, '_' or '$'
+_KEY_TAIL = re.compile(r'[\w$-]*').match
+_ASCII_UNQUOTED_KEY = re.compile(r'[A-Za-z_$][\w$-]*').match
+
+# Matchers for a UUID in 8-4-4-4-12 form running up to a delimiter (with its
+# hex digit runs as groups 1-5), an unquoted literal up to its delimiter, and
+# the YYYY- start of a date
+_UUID = re.compile(
+    r'([0-9a-fA-F]{8})-([0-9a-fA-F]{4})-([0-9a-fA-F]{4})-([0-9a-fA-F]{4})-([0-9a-fA-F]{12})'
+    r'(?![^ \t\n\r,\]}])'
+).match
+_UNQUOTED_LITERAL = re.compile(r'[^ \t\n\r,\]}]*').match
+_DATE_START = re.compile(r'[0-9]{4}-').match
+
+# Matcher for a whole number literal: integer part, then optional fraction,
+# exponent and BigInt/Decimal128 suffix as groups 1-3
+_NUMBER = re.compile(r'-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?([nm])?').match
+
+
 class JSONDecodeError(ValueError):
     """JSON decoding error."""
     
@@ -25,11 +70,12 @@ class JSONDecodeError(ValueError):
 class Parser:
     """kJSON parser with JSON5 support."""
     
-    def __init__(self, text: str):
-        """Initialize parser with text."""
+    def __init__(self, text: str, object_hook: Optional[Callable[[dict], Any]] = None):
+        """Initialize parser with text and an optional hook applied to each object."""
         self.text = text
         self.pos = 0
         self.length = len(text)
+        self.object_hook = object_hook
     
     def parse(self) -> Any:
         """Parse the JSON text."""
@@ -65,110 +111,54 @@ class Parser:
     
     def skip_whitespace(self):
         """Skip whitespace and comments."""
-        while self.pos < self.length:
-            ch = self.text[self.pos]
-            
-            if ch in ' \t\n\r':
-                self.advance()
-            elif ch == '/' and self.peek_char(1) == '/':
-                # Line comment
-                self.advance(2)
-                while self.pos < self.length and self.text[self.pos] != '\n':
-                    self.advance()
-            elif ch == '/' and self.peek_char(1) == '*':
-                # Block comment
-                self.advance(2)
-                while self.pos < self.length - 1:
-                    if self.text[self.pos] == '*' and self.text[self.pos + 1] == '/':
-                        self.advance(2)
-                        break
-                    self.advance()
-            else:
-                break
+        self.pos = _INSIGNIFICANT(self.text, self.pos).end()
     
     def parse_value(self) -> Any:
         """Parse any JSON value."""
-        self.skip_whitespace()
+        self.pos = _INSIGNIFICANT(self.text, self.pos).end()
         
         if self.pos >= self.length:
             raise JSONDecodeError("Unexpected end of JSON input", self.text, self.pos)
         
-        ch = self.text[self.pos]
-        
-        # null
-        if ch == 'n':
-            return self.parse_null()
+        # Dispatch on the first character; anything else is an unquoted literal (UUID, Date)
+        return _VALUE_PARSERS.get(self.text[self.pos], Parser.parse_unquoted_literal)(self)
+    
+    def parse_boolean_or_literal(self) -> Union[bool, uuid.UUID, Date]:
+        """Parse a value starting with 't' or 'f': a boolean or a UUID."""
+        # Literal keywords can be decided up front without backtracking
+        if self.text.startswith('true', self.pos):
+            self.pos += 4
+            return True
+        if self.text.startswith('false', self.pos):
+            self.pos += 5
+            return False
         
-        # boolean or unquoted literal
-        elif ch == 't' or ch == 'f':
-            # Try unquoted literal first (could be UUID)
-            saved_pos = self.pos
-            try:
-                return self.parse_unquoted_literal()
-            except:
-                self.pos = saved_pos
-                return self.parse_boolean()
-        
-        # string
-        elif ch == '"' or ch == "'" or ch == '`':
-            return self.parse_string()
-        
-        # array
-        elif ch == '[':
-            return self.parse_array()
-        
-        # object
-        elif ch == '{':
-            return self.parse_object()
-        
-        # number or date/uuid
-        elif ch == '-' or ch.isdigit():
-            # Need to look ahead to determine if this is a number or UUID/Date
-            # UUIDs have format: 8-4-4-4-12 hex digits
-            # Dates have format: YYYY-MM-DD
-            saved_pos = self.pos
-            
-            # Try to detect UUID pattern (8 hex chars followed by -)
-            is_uuid = False
-            if ch.isdigit() or (ch >= 'a' and ch <= 'f'):
-                # Count hex digits
-                hex_count = 0
-                temp_pos = self.pos
-                while temp_pos < self.length and hex_count < 9:
-                    c = self.text[temp_pos]
-                    if (c >= '0' and c <= '9') or (c >= 'a' and c <= 'f') or (c >= 'A' and c <= 'F'):
-                        hex_count += 1
-                        temp_pos += 1
-                    elif c == '-' and hex_count == 8:
-                        is_uuid = True
-                        break
-                    else:
-                        break
-            
-            # Try to detect date pattern (YYYY-MM-DD)
-            is_date = False
-            if not is_uuid and ch.isdigit():
-                # Check for YYYY-MM pattern
-                if self.pos + 4 < self.length and self.text[self.pos + 4] == '-':
-                    is_date = True
-            
-            if is_uuid or is_date:
-                try:
-                    return self.parse_unquoted_literal()
-                except:
-                    self.pos = saved_pos
-                    return self.parse_number()
-            else:
-                return self.parse_number()
+        # Otherwise try unquoted literal first (could be UUID)
+        saved_pos = self.pos
+        try:
+            return self.parse_unquoted_literal()
+        except JSONDecodeError:
+            self.pos = saved_pos
+            return self.parse_boolean()
+    
+    def parse_number_or_literal(self) -> Union[int, float, BigInt, Decimal128, uuid.UUID, Date]:
+        """Parse a value starting with '-' or a digit: a number, UUID or Date."""
+        # UUIDs have format: 8-4-4-4-12 hex digits
+        # Dates have format: YYYY-MM-DD
+        if _LITERAL_PREFIX(self.text, self.pos) is None:
+            return self.parse_number()
         
-        # unquoted literal (UUID, Date)
-        else:
+        saved_pos = self.pos
+        try:
             return self.parse_unquoted_literal()
+        except JSONDecodeError:
+            self.pos = saved_pos
+            return self.parse_number()
     
     def parse_null(self) -> None:
         """Parse null value."""
-        if self.text[self.pos:self.pos+4] == 'null':
-            self.advance(4)
+        if self.text.startswith('null', self.pos):
+            self.pos += 4
             return None
         raise JSONDecodeError("Invalid null value", self.text, self.pos)
     
@@ -184,216 +174,247 @@ class Parser:
     
     def parse_string(self) -> str:
         """Parse string value."""
-        quote = self.text[self.pos]
+        text = self.text
+        start = self.pos + 1  # Skip opening quote
+        quote = text[start - 1]
         if quote not in '"\'`':
-            raise JSONDecodeError("Expected string quote", self.text, self.pos)
-        
-        self.advance()  # Skip opening quote
+            raise JSONDecodeError("Expected string quote", text, start - 1)
+        
+        # Position of the next closing quote candidate; an escaped quote
+        # moves it further along
+        end = text.find(quote, start)
+        if end < 0:
+            end = self.length
+        elif text.find('\\', start, end) < 0:
+            # No escapes: the string is a single slice of the text
+            self.pos = end + 1
+            return text[start:end]
+        
+        self.pos = start
         result = []
-        
-        while self.pos < self.length:
-            ch = self.text[self.pos]
-            
-            if ch == quote:
-                self.advance()  # Skip closing quote
+        while True:
+            # Copy everything up to the next backslash or the closing quote
+            backslash = text.find('\\', self.pos, end)
+            if backslash < 0:
+                result.append(text[self.pos:end])
+                if end >= self.length:
+                    self.pos = self.length
+                    break
+                self.pos = end + 1  # Skip closing quote
                 return ''.join(result)
             
-            elif ch == '\\':
-                self.advance()
-                if self.pos >= self.length:
-                    raise JSONDecodeError("Unterminated string escape", self.text, self.pos)
-                
-                escape_ch = self.text[self.pos]
-                if escape_ch == '"':
-                    result.append('"')
-                elif escape_ch == "'":
-                    result.append("'")
-                elif escape_ch == '`':
-                    result.append('`')
-                elif escape_ch == '\\':
-                    result.append('\\')
-                elif escape_ch == '/':
-                    result.append('/')
-                elif escape_ch == 'b':
-                    result.append('\b')
-                elif escape_ch == 'f':
-                    result.append('\f')
-                elif escape_ch == 'n':
-                    result.append('\n')
-                elif escape_ch == 'r':
-                    result.append('\r')
-                elif escape_ch == 't':
-                    result.append('\t')
-                elif escape_ch == 'u':
-                    # Unicode escape
-                    self.advance()
-                    if self.pos + 4 > self.length:
-                        raise JSONDecodeError("Invalid unicode escape", self.text, self.pos)
-                    hex_digits = self.text[self.pos:self.pos+4]
-                    try:
-                        code_point = int(hex_digits, 16)
-                        result.append(chr(code_point))
-                        self.advance(3)  # We already advanced 1
-                    except ValueError:
-                        raise JSONDecodeError("Invalid unicode escape", self.text, self.pos)
-                else:
-                    raise JSONDecodeError(f"Invalid escape sequence: \\{escape_ch}", self.text, self.pos)
-                
-                self.advance()
+            result.append(text[self.pos:backslash])
             
-            else:
-                result.append(ch)
+            # Backslash escape
+            self.pos = backslash + 1
+            if self.pos >= self.length:
+                raise JSONDecodeError("Unterminated string escape", self.text, self.pos)
+            
+            escape_ch = text[self.pos]
+            unescaped = _SIMPLE_ESCAPES.get(escape_ch)
+            if unescaped is not None:
+                result.append(unescaped)
+            elif escape_ch == 'u':
+                # Unicode escape
                 self.advance()
+                if self.pos + 4 > self.length:
+                    raise JSONDecodeError("Invalid unicode escape", self.text, self.pos)
+                hex_digits = self.text[self.pos:self.pos+4]
+                try:
+                    code_point = int(hex_digits, 16)
+                    if 0xD800 <= code_point <= 0xDBFF and text.startswith('\\u', self.pos + 4):
+                        # High surrogate followed by another escape: combine a valid pair
+                        try:
+                            low = int(text[self.pos+6:self.pos+10], 16)
+                        except ValueError:
+                            low = 0  # Reported when the next escape is parsed
+                        if 0xDC00 <= low <= 0xDFFF:
+                            code_point = 0x10000 + ((code_point - 0xD800) << 10) + (low - 0xDC00)
+                            self.advance(6)
+                    result.append(chr(code_point))
+                    self.advance(3)  # We already advanced 1
+                except ValueError:
+                    raise JSONDecodeError("Invalid unicode escape", self.text, self.pos)
+            else:
+                raise JSONDecodeError(f"Invalid escape sequence: \\{escape_ch}", self.text, self.pos)
+            
+            self.pos += 1
+            if self.pos > end:
+                # The escape consumed the quote found earlier; find the next one
+                end = text.find(quote, self.pos)
+                if end < 0:
+                    end = self.length
         
         raise JSONDecodeError("Unterminated string", self.text, self.pos)
     
     def parse_number(self) -> Union[int, float, BigInt, Decimal128]:
         """Parse number value."""
+        text = self.text
         start = self.pos
         
-        # Optional negative
-        if self.current_char() == '-':
-            self.advance()
+        match = _NUMBER(text, start)
+        if match is None:
+            pos = start + 1 if text.startswith('-', start) else start
+            raise JSONDecodeError("Invalid number", text, pos)
         
-        # Integer part
-        if self.current_char() == '0':
-            self.advance()
-        elif self.current_char() and self.current_char().isdigit():
-            while self.current_char() and self.current_char().isdigit():
-                self.advance()
-        else:
-            raise JSONDecodeError("Invalid number", self.text, self.pos)
-        
-        # Fractional part
-        has_fraction = False
-        if self.current_char() == '.':
-            has_fraction = True
-            self.advance()
-            if not self.current_char() or not self.current_char().isdigit():
-                raise JSONDecodeError("Invalid number: expected digits after decimal", self.text, self.pos)
-            while self.current_char() and self.current_char().isdigit():
-                self.advance()
+        end = match.end()
         
-        # Exponent part
-        has_exponent = False
-        ch = self.current_char()
-        if ch and ch in 'eE':
-            has_exponent = True
-            self.advance()
-            ch = self.current_char()
-            if ch and ch in '+-':
-                self.advance()
-            if not self.current_char() or not self.current_char().isdigit():
-                raise JSONDecodeError("Invalid number: expected digits in exponent", self.text, self.pos)
-            while self.current_char() and self.current_char().isdigit():
-                self.advance()
+        # Plain integers are the common case: no optional group matched
+        if match.lastindex is None:
+            ch = text[end:end + 1]
+            if ch != '.' and ch != 'e' and ch != 'E':
+                self.pos = end
+                return int(text[start:end])
+        
+        fraction, exponent, suffix = match.group(1, 2, 3)
+        
+        # A dangling '.' or exponent marker means the number is malformed
+        if suffix is None:
+            ch = text[end:end + 1]
+            if ch == '.' and fraction is None and exponent is None:
+                raise JSONDecodeError("Invalid number: expected digits after decimal", text, end + 1)
+            if (ch == 'e' or ch == 'E') and exponent is None:
+                pos = end + 1
+                ch = text[pos:pos + 1]
+                if ch == '+' or ch == '-':
+                    pos += 1
+                raise JSONDecodeError("Invalid number: expected digits in exponent", text, pos)
+        
+        self.pos = end
         
         # Check for BigInt suffix
-        if self.current_char() == 'n':
-            self.advance()
-            if has_fraction or has_exponent:
-                raise JSONDecodeError("BigInt cannot have fractional or exponent parts", self.text, start)
-            return BigInt(self.text[start:self.pos-1])
+        if suffix == 'n':
+            if fraction is not None or exponent is not None:
+                raise JSONDecodeError("BigInt cannot have fractional or exponent parts", text, start)
+            return BigInt(text[start:end - 1])
         
         # Check for Decimal128 suffix
-        if self.current_char() == 'm':
-            self.advance()
-            return Decimal128(self.text[start:self.pos-1])
+        if suffix == 'm':
+            return Decimal128(text[start:end - 1])
         
         # Regular number
-        num_str = self.text[start:self.pos]
-        if has_fraction or has_exponent:
-            return float(num_str)
+        if fraction is not None or exponent is not None:
+            return float(text[start:end])
         else:
-            value = int(num_str)
-            # Keep as int if it fits in Python int range
-            return value
+            return int(text[start:end])
     
     def parse_array(self) -> List[Any]:
         """Parse array value."""
-        if self.current_char() != '[':
+        text = self.text
+        skip = _INSIGNIFICANT
+        if text[self.pos:self.pos + 1] != '[':
             raise JSONDecodeError("Expected '['", self.text, self.pos)
         
-        self.advance()  # Skip '['
+        self.pos += 1  # Skip '['
         result = []
+        append = result.append
+        length = self.length
+        value_parser = _VALUE_PARSERS.get
+        parse_literal = Parser.parse_unquoted_literal
         
-        self.skip_whitespace()
+        self.pos = skip(text, self.pos).end()
         
         # Empty array
-        if self.current_char() == ']':
-            self.advance()
+        if text[self.pos:self.pos + 1] == ']':
+            self.pos += 1
             return result
         
         while True:
-            # Parse value
-            result.append(self.parse_value())
-            self.skip_whitespace()
+            # Parse value, dispatching inline rather than through parse_value();
+            # insignificant text before it has already been skipped
+            pos = self.pos
+            if pos >= length:
+                raise JSONDecodeError("Unexpected end of JSON input", text, pos)
+            append(value_parser(text[pos], parse_literal)(self))
+            self.pos = skip(text, self.pos).end()
             
-            ch = self.current_char()
+            ch = text[self.pos:self.pos + 1]
             if ch == ',':
-                self.advance()
-                self.skip_whitespace()
+                self.pos += 1
+                self.pos = skip(text, self.pos).end()
                 # Allow trailing comma
-                if self.current_char() == ']':
-                    self.advance()
+                if text[self.pos:self.pos + 1] == ']':
+                    self.pos += 1
                     return result
             elif ch == ']':
-                self.advance()
+                self.pos += 1
                 return result
             else:
                 raise JSONDecodeError("Expected ',' or ']' in array", self.text, self.pos)
     
-    def parse_object(self) -> Dict[str, Any]:
-        """Parse object value."""
-        if self.current_char() != '{':
+    def parse_object(self) -> Any:
+        """Parse object value, passing it through the object hook if one is set."""
+        text = self.text
+        skip = _INSIGNIFICANT
+        if text[self.pos:self.pos + 1] != '{':
             raise JSONDecodeError("Expected '{'", self.text, self.pos)
         
-        self.advance()  # Skip '{'
+        self.pos += 1  # Skip '{'
         result = {}
+        key_cache_get = _KEY_CACHE.get
+        length = self.length
+        value_parser = _VALUE_PARSERS.get
+        parse_literal = Parser.parse_unquoted_literal
         
-        self.skip_whitespace()
+        self.pos = skip(text, self.pos).end()
         
         # Empty object
-        if self.current_char() == '}':
-            self.advance()
-            return result
+        if text[self.pos:self.pos + 1] == '}':
+            self.pos += 1
+            return result if self.object_hook is None else self.object_hook(result)
         
         while True:
             # Parse key
-            self.skip_whitespace()
+            self.pos = skip(text, self.pos).end()
             
-            ch = self.current_char()
+            ch = text[self.pos:self.pos + 1]
             if ch == '"' or ch == "'" or ch == '`':
                 # Quoted key
                 key = self.parse_string()
             else:
-                # Unquoted key (JSON5)
-                key = self.parse_unquoted_key()
+                # Unquoted key (JSON5); the common ASCII-initial form takes a
+                # single match, anything else gets the full first-character check
+                match = _ASCII_UNQUOTED_KEY(text, self.pos)
+                if match is not None:
+                    key = match.group()
+                    self.pos = match.end()
+                else:
+                    key = self.parse_unquoted_key()
+            
+            if len(key) <= _KEY_CACHE_MAX_LENGTH:
+                cached = key_cache_get(key)
+                if cached is None:
+                    if len(_KEY_CACHE) >= _KEY_CACHE_SIZE:
+                        _KEY_CACHE.clear()
+                    _KEY_CACHE[key] = key
+                else:
+                    key = cached
             
-            self.skip_whitespace()
+            self.pos = skip(text, self.pos).end()
             
             # Expect colon
-            if self.current_char() != ':':
+            if text[self.pos:self.pos + 1] != ':':
                 raise JSONDecodeError("Expected ':' after object key", self.text, self.pos)
-            self.advance()
             
-            # Parse value
-            value = self.parse_value()
-            result[key] = value
+            # Parse value, dispatching inline rather than through parse_value()
+            self.pos = pos = skip(text, self.pos + 1).end()
+            if pos >= length:
+                raise JSONDecodeError("Unexpected end of JSON input", text, pos)
+            result[key] = value_parser(text[pos], parse_literal)(self)
             
-            self.skip_whitespace()
+            self.pos = skip(text, self.pos).end()
             
-            ch = self.current_char()
+            ch = text[self.pos:self.pos + 1]
             if ch == ',':
-                self.advance()
-                self.skip_whitespace()
+                self.pos += 1
+                self.pos = skip(text, self.pos).end()
                 # Allow trailing comma
-                if self.current_char() == '}':
-                    self.advance()
-                    return result
+                if text[self.pos:self.pos + 1] == '}':
+                    self.pos += 1
+                    return result if self.object_hook is None else self.object_hook(result)
             elif ch == '}':
-                self.advance()
-                return result
+                self.pos += 1
+                return result if self.object_hook is None else self.object_hook(result)
             else:
                 raise JSONDecodeError("Expected ',' or '}' in object", self.text, self.pos)
     
@@ -401,29 +422,13 @@ class Parser:
         """Parse unquoted object key (JSON5)."""
         start = self.pos
         
-        # For object keys, we need to check if it could be a literal value
-        # Try to parse as unquoted literal first
-        saved_pos = self.pos
-        try:
-            # Check if it's a valid literal (UUID/Date)
-            literal = self.parse_unquoted_literal()
-            # If we got here, it's a literal value, not a key
-            # This shouldn't happen in valid JSON - reset and treat as key
-            self.pos = saved_pos
-        except:
-            # Not a literal, continue as key
-            self.pos = saved_pos
-        
         # First character must be letter, underscore, or dollar
         ch = self.current_char()
         if not ch or not (ch.isalpha() or ch in '_$'):
             raise JSONDecodeError("Invalid unquoted key", self.text, self.pos)
         
-        self.advance()
-        
         # Subsequent characters
-        while self.current_char() and (self.current_char().isalnum() or self.current_char() in '_$' or self.current_char() == '-'):
-            self.advance()
+        self.pos = _KEY_TAIL(self.text, start + 1).end()
         
         return self.text[start:self.pos]
     
@@ -431,31 +436,43 @@ class Parser:
         """Parse unquoted literal (UUID or Date)."""
         start = self.pos
         
-        # Read until delimiter
-        while self.pos < self.length:
-            ch = self.text[self.pos]
-            if ch in ' \t\n\r,]}':
-                break
-            self.advance()
+        # UUIDs are built straight from their hex digits, skipping the string
+        # normalization uuid.UUID() would redo on an already validated shape
+        match = _UUID(self.text, start)
+        if match is not None:
+            self.pos = match.end()
+            return uuid.UUID(int=int(''.join(match.groups()), 16))
         
+        # Read until delimiter
+        self.pos = _UNQUOTED_LITERAL(self.text, start).end()
         literal = self.text[start:self.pos]
         
-        # Try UUID
-        try:
-            return uuid.UUID(literal)
-        except ValueError:
-            pass
-        
-        # Try Date
-        try:
-            return Date(literal)
-        except:
-            pass
+        # Only hand literals of the right shape to the Date constructor
+        if _DATE_START(literal):
+            try:
+                return Date(literal)
+            except:
+                pass
         
         raise JSONDecodeError(f"Invalid unquoted literal: {literal}", self.text, start)
 
 
-def parse(text: str) -> Any:
-    """Parse kJSON text."""
-    parser = Parser(text)
+# First-character dispatch table for Parser.parse_value
+_VALUE_PARSERS = {
+    'n': Parser.parse_null,
+    't': Parser.parse_boolean_or_literal,
+    'f': Parser.parse_boolean_or_literal,
+    '"': Parser.parse_string,
+    "'": Parser.parse_string,
+    '`': Parser.parse_string,
+    '[': Parser.parse_array,
+    '{': Parser.parse_object,
+    '-': Parser.parse_number_or_literal,
+    **dict.fromkeys('0123456789', Parser.parse_number_or_literal),
+}
+
+
+def parse(text: str, object_hook: Optional[Callable[[dict], Any]] = None) -> Any:
+    """Parse kJSON text, calling object_hook with each decoded object if given."""
+    parser = Parser(text, object_hook)
     return parser.parse()
\ No newline at end of file
@@ -1,35 +1,67 @@
 """kJSON serializer implementation."""
 
+import functools
 import json
+import re
 import uuid
-from typing import Any, Dict, Optional, Union
-from .types import BigInt, Decimal128, Date
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from .types import BigInt, Decimal128, Date, Instant, Duration
+
+
+# Searches for any character escape_string would rewrite, per quote style.
+# With ensure_ascii, control and non-ASCII characters are escaped as well.
+_NEEDS_ESCAPE = {q: re.compile(r'[\\\b\f\n\r\t%s]' % q).search for q in '"\'`'}
+_NEEDS_ESCAPE_ASCII = {q: re.compile(r'[\\%s\x00-\x1f\x7f-\U0010ffff]' % q).search for q in '"\'`'}
+
+# Searches for anything that rules out writing a string verbatim in single
+# quotes (any quote character or escapable character), keyed by ensure_ascii
+_NOT_PLAIN = {
+    False: re.compile(r'[\\\'"`\b\f\n\r\t]').search,
+    True: re.compile(r'[\\\'"`\x00-\x1f\x7f-\U0010ffff]').search,
+}
+
+# Runs of characters written as \uXXXX escapes when ensure_ascii is set
+_NON_ASCII = re.compile(r'[\x00-\x1f\x7f-\U0010ffff]+')
+
+# Approximate size of the chunks yielded by dumps_iter
+_ITER_CHUNK_SIZE = 65536
+
+# Rendered key prefixes per (ensure_ascii, object keys); only small objects
+# with short keys are kept, and it is cleared when full
+_KEY_PREFIX_CACHE: Dict[Tuple[bool, Tuple[str, ...]], Tuple[str, ...]] = {}
+_KEY_PREFIX_CACHE_SIZE = 1024
+_KEY_PREFIX_CACHE_MAX_KEYS = 32
+_KEY_PREFIX_CACHE_MAX_CHARS = 1024
+
+# Precomputed newline-plus-indentation strings for pretty printing, bare and
+# preceded by the item separator
+_NEWLINE_INDENTS_SIZE = 128
+_NEWLINE_INDENTS = tuple('\n' + ' ' * width for width in range(_NEWLINE_INDENTS_SIZE))
+_ITEM_SEPARATORS = tuple(',' + newline for newline in _NEWLINE_INDENTS)
 
 
 def serialize_string(s: str, ensure_ascii: bool = True) -> str:
     """Serialize string with smart quote selection."""
-    # Count occurrences of each quote type
-    single_quotes = s.count("'")
-    double_quotes = s.count('"')
-    backticks = s.count('`')
-    backslashes = s.count('\\')
-    
-    # Calculate escaping cost for each quote type
-    single_cost = single_quotes + backslashes
-    double_cost = double_quotes + backslashes
-    backtick_cost = backticks + backslashes
-    
-    # Find minimum cost and choose quote type
+    # Fast path: no quotes and nothing to escape, so every quote style costs
+    # nothing and the tie-break picks single quotes
+    if _NOT_PLAIN[bool(ensure_ascii)](s) is None:
+        return "'" + s + "'"
+    
+    # Choose the quote type needing the fewest escapes. Backslashes are
+    # escaped under every quote type, so they do not affect the choice, and
+    # later counts are only taken while a cheaper quote type is still possible.
     # In case of tie: single > double > backtick
-    min_cost = single_cost
+    min_cost = s.count("'")
     quote_char = "'"
     
-    if double_cost < min_cost:
-        min_cost = double_cost
-        quote_char = '"'
-    
-    if backtick_cost < min_cost:
-        quote_char = '`'
+    if min_cost:
+        double_cost = s.count('"')
+        if double_cost < min_cost:
+            min_cost = double_cost
+            quote_char = '"'
+        
+        if min_cost and s.count('`') < min_cost:
+            quote_char = '`'
     
     # Escape the string for the chosen quote type
     escaped = escape_string(s, quote_char, ensure_ascii)
@@ -37,8 +69,31 @@ def serialize_string(s: str, ensure_ascii: bool = True) -> str:
     return quote_char + escaped + quote_char
 
 
+def serialize_key(key: str, ensure_ascii: bool = True) -> str:
+    """Serialize an object key, leaving valid identifiers unquoted."""
+    if _is_bare_key(key):
+        return key
+    return serialize_string(key, ensure_ascii)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_bare_key(key: str) -> bool:
+    """Return whether key can be written without quotes."""
+    return key.isidentifier() and not key.startswith('$')
+
+
 def escape_string(s: str, quote_char: str, ensure_ascii: bool = True) -> str:
     """Escape a string for the given quote character."""
+    # Most strings contain nothing to escape: one C-level scan settles it
+    needs_escape = (_NEEDS_ESCAPE_ASCII if ensure_ascii else _NEEDS_ESCAPE)[quote_char]
+    if needs_escape(s) is None:
+        return s
+    
+    # Chained str.replace beats a single str.translate pass here: each replace
+    # is a C-level scan that returns the string itself when the character is
+    # absent, while translate with multi-character replacements does a
+    # mapping lookup per character
+    
     # Handle backslashes first
     escaped = s.replace('\\', '\\\\')
     
@@ -59,143 +114,255 @@ def escape_string(s: str, quote_char: str, ensure_ascii: bool = True) -> str:
     
     # Handle Unicode escaping if needed
     if ensure_ascii:
-        # Use Python's built-in encoding to handle unicode escapes
-        encoded = escaped.encode('unicode_escape').decode('ascii')
-        # Fix double-escaping of backslashes
-        encoded = encoded.replace('\\\\', '\\')
-        return encoded
+        return _NON_ASCII.sub(_unicode_escape_run, escaped)
     
     return escaped
 
 
+def _unicode_escape_run(match: re.Match) -> str:
+    """Return the \\uXXXX escapes for a matched run of characters."""
+    # Escaping whole runs through a cached per-character table avoids a
+    # callback and a format operation for every character of non-ASCII text
+    run = match.group()
+    if len(run) == 1:
+        return _unicode_escape(run)
+    return ''.join(map(_unicode_escape, run))
+
+
+@functools.lru_cache(maxsize=4096)
+def _unicode_escape(char: str) -> str:
+    """Return the \\uXXXX escape for a character."""
+    code_point = ord(char)
+    if code_point > 0xFFFF:
+        # Outside the BMP: escape as a UTF-16 surrogate pair
+        code_point -= 0x10000
+        return '\\u%04x\\u%04x' % (0xD800 | (code_point >> 10), 0xDC00 | (code_point & 0x3FF))
+    return '\\u%04x' % code_point
+
+
 def serialize_value(
     obj: Any,
     indent: int = 0,
     current_indent: int = 0,
     sort_keys: bool = False,
-    ensure_ascii: bool = True
+    ensure_ascii: bool = True,
+    default: Optional[callable] = None
 ) -> str:
     """Serialize a value to kJSON format."""
+    out = []
+    _write_value(obj, out, indent, current_indent, sort_keys, ensure_ascii, default)
+    return ''.join(out)
+
+
+def serialize_array(
+    arr: Union[list, tuple],
+    indent: int,
+    current_indent: int,
+    sort_keys: bool,
+    ensure_ascii: bool,
+    default: Optional[callable] = None
+) -> str:
+    """Serialize array to kJSON format."""
+    out = []
+    _write_array(arr, out, indent, current_indent, sort_keys, ensure_ascii, default)
+    return ''.join(out)
+
+
+def serialize_object(
+    obj: Dict[str, Any],
+    indent: int,
+    current_indent: int,
+    sort_keys: bool,
+    ensure_ascii: bool,
+    default: Optional[callable] = None
+) -> str:
+    """Serialize object to kJSON format."""
+    out = []
+    _write_object(obj, out, indent, current_indent, sort_keys, ensure_ascii, default)
+    return ''.join(out)
+
+
+def _write_value(
+    obj: Any,
+    out: List[str],
+    indent: int,
+    current_indent: int,
+    sort_keys: bool,
+    ensure_ascii: bool,
+    default: Optional[callable] = None
+) -> None:
+    """Append the kJSON text for obj to out."""
     if obj is None:
-        return "null"
+        out.append("null")
+    
+    elif isinstance(obj, str):
+        # Strings are the most common value; plain ones skip quote selection
+        if _NOT_PLAIN[bool(ensure_ascii)](obj) is None:
+            out.append("'" + obj + "'")
+        else:
+            out.append(serialize_string(obj, ensure_ascii))
     
     elif isinstance(obj, bool):
-        return "true" if obj else "false"
+        out.append("true" if obj else "false")
     
     elif isinstance(obj, BigInt):
-        return obj.to_kjson_string()
+        out.append(obj.to_kjson_string())
     
     elif isinstance(obj, Decimal128):
-        return obj.to_kjson_string()
+        out.append(obj.to_kjson_string())
     
     elif isinstance(obj, Date):
-        return obj.to_iso8601()
+        out.append(obj.to_iso8601())
     
     elif isinstance(obj, uuid.UUID):
-        return str(obj)
+        out.append(str(obj))
     
     elif isinstance(obj, (int, float)):
         # Check for special float values
         if isinstance(obj, float):
             if obj != obj:  # NaN
-                return "null"
+                out.append("null")
+                return
             elif obj == float('inf'):
-                return "null"
+                out.append("null")
+                return
             elif obj == float('-inf'):
-                return "null"
-        return json.dumps(obj)
-    
-    elif isinstance(obj, str):
-        # Use smart quote selection
-        return serialize_string(obj, ensure_ascii)
+                out.append("null")
+                return
+        out.append(json.dumps(obj))
     
     elif isinstance(obj, (list, tuple)):
-        return serialize_array(obj, indent, current_indent, sort_keys, ensure_ascii)
+        _write_array(obj, out, indent, current_indent, sort_keys, ensure_ascii, default)
     
     elif isinstance(obj, dict):
-        return serialize_object(obj, indent, current_indent, sort_keys, ensure_ascii)
+        _write_object(obj, out, indent, current_indent, sort_keys, ensure_ascii, default)
     
     else:
+        # Let the default function convert unknown types, then write its result
+        if default is not None:
+            try:
+                converted = default(obj)
+            except TypeError:
+                converted = obj
+            if converted is not obj:
+                _write_value(converted, out, indent, current_indent, sort_keys, ensure_ascii, default)
+                return
+        
+        # Instants and Durations have no instance __dict__ (they use
+        # __slots__), so write the object their attributes always produced
+        if isinstance(obj, (Instant, Duration)):
+            _write_object({'nanoseconds': obj.nanoseconds}, out, indent, current_indent,
+                          sort_keys, ensure_ascii, default)
+        
         # For other types, try to convert to dict
-        if hasattr(obj, '__dict__'):
-            return serialize_object(obj.__dict__, indent, current_indent, sort_keys, ensure_ascii)
+        elif hasattr(obj, '__dict__'):
+            _write_object(obj.__dict__, out, indent, current_indent, sort_keys, ensure_ascii, default)
         else:
             # Fallback to string representation
-            return json.dumps(str(obj), ensure_ascii=ensure_ascii)
+            out.append(json.dumps(str(obj), ensure_ascii=ensure_ascii))
 
 
-def serialize_array(
+def _write_array(
     arr: Union[list, tuple],
+    out: List[str],
     indent: int,
     current_indent: int,
     sort_keys: bool,
-    ensure_ascii: bool
-) -> str:
-    """Serialize array to kJSON format."""
+    ensure_ascii: bool,
+    default: Optional[callable] = None
+) -> None:
+    """Append the kJSON text for an array to out."""
     if not arr:
-        return "[]"
+        out.append("[]")
+        return
+    
+    # Local aliases for the per-item loop
+    append = out.append
+    write_value = _write_value
+    items = iter(arr)
     
     if indent > 0:
         # Pretty print
         inner_indent = current_indent + indent
-        items = []
-        
-        for item in arr:
-            item_str = serialize_value(item, indent, inner_indent, sort_keys, ensure_ascii)
-            items.append(' ' * inner_indent + item_str)
-        
-        return '[\n' + ',\n'.join(items) + '\n' + ' ' * current_indent + ']'
+        separator = _item_separator(inner_indent)
+        append('[' + _newline_indent(inner_indent))
+        write_value(next(items), out, indent, inner_indent, sort_keys, ensure_ascii, default)
+        for item in items:
+            append(separator)
+            write_value(item, out, indent, inner_indent, sort_keys, ensure_ascii, default)
+        append(_newline_indent(current_indent) + ']')
     else:
         # Compact
-        items = [serialize_value(item, 0, 0, sort_keys, ensure_ascii) for item in arr]
-        return '[' + ', '.join(items) + ']'
+        append('[')
+        write_value(next(items), out, 0, 0, sort_keys, ensure_ascii, default)
+        for item in items:
+            append(', ')
+            write_value(item, out, 0, 0, sort_keys, ensure_ascii, default)
+        append(']')
 
 
-def serialize_object(
+def _write_object(
     obj: Dict[str, Any],
+    out: List[str],
     indent: int,
     current_indent: int,
     sort_keys: bool,
-    ensure_ascii: bool
-) -> str:
-    """Serialize object to kJSON format."""
+    ensure_ascii: bool,
+    default: Optional[callable] = None
+) -> None:
+    """Append the kJSON text for an object to out."""
     if not obj:
-        return "{}"
+        out.append("{}")
+        return
+    
+    keys = tuple(sorted(obj) if sort_keys else obj)
+    prefixes = key_prefixes(keys, ensure_ascii)
     
-    keys = sorted(obj.keys()) if sort_keys else obj.keys()
+    # Local aliases for the per-member loop
+    append = out.append
+    write_value = _write_value
     
     if indent > 0:
         # Pretty print
         inner_indent = current_indent + indent
-        items = []
-        
-        for key in keys:
-            # Use unquoted keys if they're valid identifiers
-            if key.isidentifier() and not key.startswith('$'):
-                key_str = key
-            else:
-                key_str = serialize_string(key, ensure_ascii)
-            
-            value = obj[key]
-            value_str = serialize_value(value, indent, inner_indent, sort_keys, ensure_ascii)
-            items.append(f"{' ' * inner_indent}{key_str}: {value_str}")
-        
-        return '{\n' + ',\n'.join(items) + '\n' + ' ' * current_indent + '}'
+        separator = _item_separator(inner_indent)
+        append('{' + _newline_indent(inner_indent))
+        for i, key in enumerate(keys):
+            if i:
+                append(separator)
+            append(prefixes[i])
+            write_value(obj[key], out, indent, inner_indent, sort_keys, ensure_ascii, default)
+        append(_newline_indent(current_indent) + '}')
     else:
         # Compact
-        items = []
-        for key in keys:
-            # Use unquoted keys if they're valid identifiers
-            if key.isidentifier() and not key.startswith('$'):
-                key_str = key
-            else:
-                key_str = serialize_string(key, ensure_ascii)
-            
-            value = obj[key]
-            value_str = serialize_value(value, 0, 0, sort_keys, ensure_ascii)
-            items.append(f"{key_str}: {value_str}")
-        
-        return '{' + ', '.join(items) + '}'
+        append('{')
+        for i, key in enumerate(keys):
+            if i:
+                append(', ')
+            append(prefixes[i])
+            write_value(obj[key], out, 0, 0, sort_keys, ensure_ascii, default)
+        append('}')
+
+
+def key_prefixes(keys: Tuple[str, ...], ensure_ascii: bool) -> Tuple[str, ...]:
+    """Return the serialized 'key: ' prefix for each key of an object shape.
+    
+    Records serialized repeatedly tend to share the same keys, so the
+    prefixes are cached per key tuple and rendered only on first sight.
+    Large objects and long keys are rendered without touching the cache.
+    """
+    if len(keys) > _KEY_PREFIX_CACHE_MAX_KEYS:
+        return tuple(serialize_key(key, ensure_ascii) + ': ' for key in keys)
+    
+    cache_key = (ensure_ascii, keys)
+    prefixes = _KEY_PREFIX_CACHE.get(cache_key)
+    if prefixes is None:
+        prefixes = tuple(serialize_key(key, ensure_ascii) + ': ' for key in keys)
+        if sum(map(len, prefixes)) <= _KEY_PREFIX_CACHE_MAX_CHARS:
+            if len(_KEY_PREFIX_CACHE) >= _KEY_PREFIX_CACHE_SIZE:
+                _KEY_PREFIX_CACHE.clear()
+            _KEY_PREFIX_CACHE[cache_key] = prefixes
+    return prefixes
 
 
 def dumps(
@@ -230,31 +397,133 @@ def dumps(
     Returns:
         kJSON formatted string
     """
-    # Convert indent to int
-    indent_level = 0
-    if indent is not None:
-        if isinstance(indent, str):
-            indent_level = len(indent)
-        else:
-            indent_level = int(indent)
+    indent_level = _indent_width(indent)
+    return serialize_value(obj, indent_level, 0, sort_keys, ensure_ascii, default)
+
+
+def dumps_iter(
+    obj: Any,
+    *,
+    ensure_ascii: bool = False,
+    indent: Optional[Union[int, str]] = None,
+    default: Optional[callable] = None,
+    sort_keys: bool = False,
+    chunk_size: int = _ITER_CHUNK_SIZE,
+    **kw
+) -> Iterator[str]:
+    """Serialize obj to kJSON text yielded in chunks.
     
-    # Apply default function if provided
-    if default is not None:
-        obj = _apply_default(obj, default)
+    Arrays and objects are walked incrementally, so only about chunk_size
+    characters of output are buffered at a time. Joining the chunks gives
+    the same text as dumps() with the same options.
     
-    return serialize_value(obj, indent_level, 0, sort_keys, ensure_ascii)
+    Args:
+        obj: Object to serialize
+        ensure_ascii: Escape non-ASCII characters
+        indent: Indentation level (int or string)
+        default: Function to convert non-serializable objects
+        sort_keys: Sort object keys
+        chunk_size: Approximate number of characters per yielded chunk
+        **kw: Additional dumps() keyword arguments (ignored)
+    
+    Yields:
+        Consecutive pieces of the kJSON formatted string
+    """
+    indent_level = _indent_width(indent)
+    
+    buffer = []
+    buffered = 0
+    for fragment in _iter_value(obj, indent_level, 0, sort_keys, ensure_ascii, default):
+        buffer.append(fragment)
+        buffered += len(fragment)
+        if buffered >= chunk_size:
+            yield ''.join(buffer)
+            buffer = []
+            buffered = 0
+    
+    if buffer:
+        yield ''.join(buffer)
 
 
-def _apply_default(obj: Any, default: callable) -> Any:
-    """Apply default function to non-serializable objects."""
-    if obj is None or isinstance(obj, (bool, int, float, str, BigInt, Decimal128, Date, uuid.UUID)):
-        return obj
-    elif isinstance(obj, (list, tuple)):
-        return [_apply_default(item, default) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: _apply_default(v, default) for k, v in obj.items()}
+def _iter_value(
+    obj: Any,
+    indent: int,
+    current_indent: int,
+    sort_keys: bool,
+    ensure_ascii: bool,
+    default: Optional[callable] = None
+) -> Iterator[str]:
+    """Yield kJSON text for obj, descending into non-empty arrays and objects."""
+    if isinstance(obj, (list, tuple)) and obj:
+        if indent > 0:
+            inner_indent = current_indent + indent
+            newline = _newline_indent(inner_indent)
+            separator = _item_separator(inner_indent)
+            yield '[' + newline
+            for i, item in enumerate(obj):
+                if i:
+                    yield separator
+                yield from _iter_value(item, indent, inner_indent, sort_keys, ensure_ascii, default)
+            yield _newline_indent(current_indent) + ']'
+        else:
+            yield '['
+            for i, item in enumerate(obj):
+                if i:
+                    yield ', '
+                yield from _iter_value(item, 0, 0, sort_keys, ensure_ascii, default)
+            yield ']'
+    
+    elif isinstance(obj, dict) and obj:
+        keys = tuple(sorted(obj) if sort_keys else obj)
+        prefixes = key_prefixes(keys, ensure_ascii)
+        if indent > 0:
+            inner_indent = current_indent + indent
+            newline = _newline_indent(inner_indent)
+            separator = _item_separator(inner_indent)
+            yield '{' + newline
+            for i, key in enumerate(keys):
+                if i:
+                    yield separator
+                yield prefixes[i]
+                yield from _iter_value(obj[key], indent, inner_indent, sort_keys, ensure_ascii, default)
+            yield _newline_indent(current_indent) + '}'
+        else:
+            yield '{'
+            for i, key in enumerate(keys):
+                if i:
+                    yield ', '
+                yield prefixes[i]
+                yield from _iter_value(obj[key], 0, 0, sort_keys, ensure_ascii, default)
+            yield '}'
+    
     else:
-        try:
-            return default(obj)
-        except TypeError:
-            return obj
\ No newline at end of file
+        yield serialize_value(obj, indent, current_indent, sort_keys, ensure_ascii, default)
+
+
+def _newline_indent(width: int) -> str:
+    """Return a newline followed by width spaces."""
+    if width < _NEWLINE_INDENTS_SIZE:
+        return _NEWLINE_INDENTS[width]
+    return _deep_newline_indent(width)
+
+
+def _item_separator(width: int) -> str:
+    """Return a comma, a newline and width spaces."""
+    if width < _NEWLINE_INDENTS_SIZE:
+        return _ITEM_SEPARATORS[width]
+    return ',' + _deep_newline_indent(width)
+
+
+@functools.lru_cache(maxsize=256)
+def _deep_newline_indent(width: int) -> str:
+    """Build (and remember) indentation too deep for the precomputed table."""
+    return '\n' + ' ' * width
+
+
+def _indent_width(indent: Optional[Union[int, str]]) -> int:
+    """Convert a dumps() indent argument to a number of spaces."""
+    if indent is None:
+        return 0
+    if isinstance(indent, str):
+        return len(indent)
+    return int(indent)
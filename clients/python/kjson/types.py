@@ -1,26 +1,99 @@
 """Extended types for kJSON."""
 
+import re
 import uuid
 import time
 import struct
+import calendar
+import functools
 import secrets
+import threading
+import warnings
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Tuple, Union
+
+# Version 7 and variant 10 bits of a UUID v7, and its 62 random rand_b bits
+_UUID_V7_VERSION_VARIANT = (0x7 << 76) | (0x2 << 62)
+_UUID_V7_RAND_B_BITS = (1 << 62) - 1
+
+# Last UUID v7 sequence value handed out: the millisecond timestamp shifted
+# left by 12 plus the 12-bit counter kept in the rand_a field, so UUIDs
+# generated within one millisecond still sort in order
+_uuid_v7_lock = threading.Lock()
+_uuid_v7_last_sequence = 0
+
+# Nanoseconds per second, minute, hour and day
+_NS_PER_SEC = 1_000_000_000
+_NS_PER_MIN = 60 * _NS_PER_SEC
+_NS_PER_HOUR = 60 * _NS_PER_MIN
+_NS_PER_DAY = 24 * _NS_PER_HOUR
+
+# Matcher for a Zulu timestamp in the YYYY-MM-DDTHH:MM:SS[.fffffffff]Z layout
+# (groups: hour, minute, second, fraction)
+_ZULU_TIMESTAMP = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]+))?Z').fullmatch
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Convert a proleptic Gregorian date to days since 1970-01-01.
+    
+    Howard Hinnant's days_from_civil: integer-only, counting in 400-year
+    eras that start on March 1st so the leap day falls at the end of each year.
+    """
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (9 if month <= 2 else -3)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _civil_from_days(days: int) -> Tuple[int, int, int]:
+    """Convert days since 1970-01-01 to a proleptic Gregorian (year, month, day).
+    
+    Integer-only inverse of _days_from_civil (Howard Hinnant's civil_from_days).
+    """
+    z = days + 719468
+    era = z // 146097
+    day_of_era = z - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 if shifted_month < 10 else shifted_month - 9
+    return year_of_era + era * 400 + (month <= 2), month, day
 
 
 class BigInt:
     """Arbitrary precision integer type."""
     
+    __slots__ = ('_value', '_str')
+    
     def __init__(self, value: Union[int, str]):
         """Initialize BigInt from int or string."""
         if isinstance(value, str):
             # Remove 'n' suffix if present
             value = value.rstrip('n')
-        self.value = int(value)
+        self._value = int(value)
+        self._str = None
+    
+    @property
+    def value(self) -> int:
+        """The integer value."""
+        return self._value
+    
+    @value.setter
+    def value(self, value: int):
+        """Set the integer value, dropping the cached string."""
+        self._value = value
+        self._str = None
     
     def __str__(self) -> str:
         """Return string representation without suffix."""
-        return str(self.value)
+        # int-to-decimal conversion is quadratic in the digit count, so the
+        # string is computed once per value
+        if self._str is None:
+            self._str = str(self.value)
+        return self._str
     
     def __repr__(self) -> str:
         """Return Python representation."""
@@ -38,12 +111,16 @@ class BigInt:
     
     def to_kjson_string(self) -> str:
         """Return kJSON string representation with 'n' suffix."""
-        return f"{self.value}n"
+        if self._str is None:
+            self._str = str(self.value)
+        return self._str + 'n'
 
 
 class Decimal128:
     """High-precision decimal type."""
     
+    __slots__ = ('negative', 'digits', 'exponent')
+    
     def __init__(self, value: Union[float, str]):
         """Initialize Decimal128 from float or string."""
         if isinstance(value, str):
@@ -114,16 +191,31 @@ class Decimal128:
         return f"{self}m"
 
 
+@functools.total_ordering
 class Instant:
     """Instant type representing a nanosecond-precision timestamp in Zulu time (UTC)."""
     
+    __slots__ = ('_nanoseconds', '_iso')
+    
     def __init__(self, nanoseconds: int):
         """Initialize Instant from nanoseconds since epoch.
         
         Args:
             nanoseconds: nanoseconds since Unix epoch (1970-01-01T00:00:00Z)
         """
-        self.nanoseconds = nanoseconds
+        self._nanoseconds = nanoseconds
+        self._iso = None
+    
+    @property
+    def nanoseconds(self) -> int:
+        """Nanoseconds since epoch."""
+        return self._nanoseconds
+    
+    @nanoseconds.setter
+    def nanoseconds(self, nanoseconds: int):
+        """Set the nanoseconds, dropping the cached ISO string."""
+        self._nanoseconds = nanoseconds
+        self._iso = None
     
     @classmethod
     def from_epoch_nanos(cls, nanos: int) -> 'Instant':
@@ -138,13 +230,12 @@ class Instant:
     @classmethod
     def from_epoch_seconds(cls, seconds: int) -> 'Instant':
         """Create Instant from seconds since epoch."""
-        return cls(seconds * 1_000_000_000)
+        return cls(seconds * _NS_PER_SEC)
     
     @classmethod
     def now(cls) -> 'Instant':
         """Get current instant."""
-        millis = int(time.time() * 1000)
-        return cls.from_epoch_millis(millis)
+        return cls(time.time_ns())
     
     @classmethod
     def from_iso8601(cls, iso_string: str) -> 'Instant':
@@ -157,8 +248,11 @@ class Instant:
         - 2025-01-01T00:00:00+00:00 (converted to Zulu)
         - 2025-01-01T00:00:00-05:00 (converted to Zulu)
         """
-        # Convert to Zulu time if it has a timezone
-        if '+' in iso_string or (iso_string.count('-') > 2):
+        # Zulu strings are by far the common case, so check the separator and
+        # suffix positions before scanning the whole string for an offset sign
+        if iso_string[-1:] == 'Z' and iso_string[10:11] == 'T':
+            zulu_string = iso_string
+        elif '+' in iso_string or (iso_string.count('-') > 2):
             # Has timezone offset, convert to Zulu
             dt = datetime.fromisoformat(iso_string)
             if dt.tzinfo is None:
@@ -166,28 +260,35 @@ class Instant:
             else:
                 dt = dt.astimezone(timezone.utc)
             zulu_string = dt.isoformat().replace('+00:00', 'Z')
-        elif not iso_string.endswith('Z'):
+        else:
             # No timezone specified, assume Zulu
             zulu_string = iso_string + 'Z'
-        else:
-            zulu_string = iso_string
         
-        # Parse the Zulu string manually to preserve nanosecond precision
-        import re
-        match = re.match(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?Z$', zulu_string)
-        if not match:
+        # Parse the Zulu string manually to preserve nanosecond precision. The
+        # YYYY-MM-DDTHH:MM:SS[.fffffffff]Z layout is fixed-width, so the fields
+        # are sliced directly rather than matched with a regex.
+        length = len(zulu_string)
+        if (not (length == 20 or (length > 21 and zulu_string[19] == '.')) or
+                zulu_string[4] != '-' or zulu_string[7] != '-' or zulu_string[10] != 'T' or
+                zulu_string[13] != ':' or zulu_string[16] != ':'):
+            raise ValueError(f"Invalid ISO date string format: {iso_string}")
+        
+        fields = (zulu_string[0:4], zulu_string[5:7], zulu_string[8:10],
+                  zulu_string[11:13], zulu_string[14:16], zulu_string[17:19])
+        fraction_str = zulu_string[20:-1]
+        if not (''.join(fields) + fraction_str).isdecimal():
             raise ValueError(f"Invalid ISO date string format: {iso_string}")
         
-        year, month, day, hour, minute, second, fraction_str = match.groups()
+        year, month, day, hour, minute, second = map(int, fields)
         
-        # Create datetime object for the main parts
-        dt = datetime(
-            int(year), int(month), int(day),
-            int(hour), int(minute), int(second),
-            tzinfo=timezone.utc
-        )
+        # The civil date arithmetic gives exact integer epoch seconds without
+        # building a datetime, but does not range-check the fields itself
+        if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= 31 and hour <= 23 and minute <= 59 and second <= 59) or (
+                day > 28 and day > calendar.monthrange(year, month)[1]):
+            raise ValueError(f"Invalid ISO date string format: {iso_string}")
         
-        nanos = int(dt.timestamp() * 1_000_000_000)
+        seconds = _days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+        nanos = seconds * _NS_PER_SEC
         
         # Handle fractional seconds
         if fraction_str:
@@ -198,28 +299,79 @@ class Instant:
         
         return cls(nanos)
     
+    @classmethod
+    def from_iso8601_batch(cls, iso_strings: Iterable[str]) -> List['Instant']:
+        """Parse many ISO 8601 strings to Instants.
+        
+        Zulu timestamps falling on the same calendar day share the date
+        arithmetic, which makes this much faster than calling from_iso8601
+        per string on log-style data. Other accepted forms are handed to
+        from_iso8601 unchanged.
+        """
+        instants = []
+        day_starts = {}
+        
+        for iso_string in iso_strings:
+            match = _ZULU_TIMESTAMP(iso_string)
+            if match is None:
+                instants.append(cls.from_iso8601(iso_string))
+                continue
+            
+            hour, minute, second, fraction_str = match.groups()
+            hour = int(hour)
+            minute = int(minute)
+            second = int(second)
+            if hour > 23 or minute > 59 or second > 59:
+                raise ValueError(f"Invalid ISO date string format: {iso_string}")
+            
+            date = iso_string[:10]
+            day_start = day_starts.get(date)
+            if day_start is None:
+                year, month, day = int(date[:4]), int(date[5:7]), int(date[8:])
+                if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= 31) or (
+                        day > 28 and day > calendar.monthrange(year, month)[1]):
+                    raise ValueError(f"Invalid ISO date string format: {iso_string}")
+                day_start = _days_from_civil(year, month, day) * _NS_PER_DAY
+                day_starts[date] = day_start
+            
+            nanos = day_start + (hour * 3600 + minute * 60 + second) * _NS_PER_SEC
+            if fraction_str:
+                # Pad or truncate to 9 digits (nanoseconds)
+                nanos += int(fraction_str.ljust(9, '0')[:9])
+            instants.append(cls(nanos))
+        
+        return instants
+    
     def to_iso8601(self) -> str:
         """Convert to ISO 8601 string with nanosecond precision."""
-        # Convert to seconds and nanosecond remainder
-        seconds = self.nanoseconds // 1_000_000_000
-        nanos_remainder = self.nanoseconds % 1_000_000_000
-        
-        # Create datetime from seconds
-        dt = datetime.fromtimestamp(seconds, tz=timezone.utc)
+        # Instances are treated as immutable, so the string is formatted once
+        if self._iso is None:
+            self._iso = self._format_iso8601()
+        return self._iso
+    
+    def _format_iso8601(self) -> str:
+        """Format the ISO 8601 string returned by to_iso8601."""
+        # Split into calendar days, time of day and nanosecond remainder
+        seconds, nanos_remainder = divmod(self.nanoseconds, _NS_PER_SEC)
+        days, seconds_of_day = divmod(seconds, 86400)
+        hour, seconds_of_hour = divmod(seconds_of_day, 3600)
+        minute, second = divmod(seconds_of_hour, 60)
+        year, month, day = _civil_from_days(days)
         
         # Format base ISO string
-        base_iso = dt.strftime("%Y-%m-%dT%H:%M:%S")
+        base_iso = f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}"
         
         if nanos_remainder == 0:
             return base_iso + 'Z'
         
-        # Format nanoseconds (remove trailing zeros)
+        # Format nanoseconds (remove trailing zeros). zfill/rstrip run in C and
+        # beat counting the trailing zeros off with a divmod loop
         fractional_str = str(nanos_remainder).zfill(9).rstrip('0')
         return base_iso + '.' + fractional_str + 'Z'
     
     def to_datetime(self) -> datetime:
         """Convert to datetime object (loses nanosecond precision)."""
-        seconds = self.nanoseconds / 1_000_000_000
+        seconds = self.nanoseconds / _NS_PER_SEC
         return datetime.fromtimestamp(seconds, tz=timezone.utc)
     
     def epoch_nanos(self) -> int:
@@ -232,7 +384,7 @@ class Instant:
     
     def epoch_seconds(self) -> int:
         """Get seconds since epoch."""
-        return self.nanoseconds // 1_000_000_000
+        return self.nanoseconds // _NS_PER_SEC
     
     def __str__(self) -> str:
         """Return ISO 8601 string representation."""
@@ -253,40 +405,36 @@ class Instant:
         return hash(self.nanoseconds)
     
     def __lt__(self, other) -> bool:
-        """Compare less than."""
+        """Compare less than (total_ordering derives the other comparisons)."""
         if isinstance(other, Instant):
             return self.nanoseconds < other.nanoseconds
         return NotImplemented
-    
-    def __le__(self, other) -> bool:
-        """Compare less than or equal."""
-        if isinstance(other, Instant):
-            return self.nanoseconds <= other.nanoseconds
-        return NotImplemented
-    
-    def __gt__(self, other) -> bool:
-        """Compare greater than."""
-        if isinstance(other, Instant):
-            return self.nanoseconds > other.nanoseconds
-        return NotImplemented
-    
-    def __ge__(self, other) -> bool:
-        """Compare greater than or equal."""
-        if isinstance(other, Instant):
-            return self.nanoseconds >= other.nanoseconds
-        return NotImplemented
 
 
 class Duration:
     """Duration type representing a time span with nanosecond precision."""
     
+    __slots__ = ('_nanoseconds', '_iso')
+    
     def __init__(self, nanoseconds: int):
         """Initialize Duration from nanoseconds.
         
         Args:
             nanoseconds: duration in nanoseconds
         """
-        self.nanoseconds = nanoseconds
+        self._nanoseconds = nanoseconds
+        self._iso = None
+    
+    @property
+    def nanoseconds(self) -> int:
+        """Nanoseconds in the duration."""
+        return self._nanoseconds
+    
+    @nanoseconds.setter
+    def nanoseconds(self, nanoseconds: int):
+        """Set the nanoseconds, dropping the cached ISO string."""
+        self._nanoseconds = nanoseconds
+        self._iso = None
     
     @classmethod
     def from_nanos(cls, nanos: int) -> 'Duration':
@@ -301,22 +449,22 @@ class Duration:
     @classmethod
     def from_seconds(cls, seconds: int) -> 'Duration':
         """Create Duration from seconds."""
-        return cls(seconds * 1_000_000_000)
+        return cls(seconds * _NS_PER_SEC)
     
     @classmethod
     def from_minutes(cls, minutes: int) -> 'Duration':
         """Create Duration from minutes."""
-        return cls(minutes * 60 * 1_000_000_000)
+        return cls(minutes * _NS_PER_MIN)
     
     @classmethod
     def from_hours(cls, hours: int) -> 'Duration':
         """Create Duration from hours."""
-        return cls(hours * 3600 * 1_000_000_000)
+        return cls(hours * _NS_PER_HOUR)
     
     @classmethod
     def from_days(cls, days: int) -> 'Duration':
         """Create Duration from days."""
-        return cls(days * 86400 * 1_000_000_000)
+        return cls(days * _NS_PER_DAY)
     
     @classmethod
     def from_iso8601(cls, duration_string: str) -> 'Duration':
@@ -324,71 +472,103 @@ class Duration:
         
         Supports formats like: PT1H2M3S, P1DT2H3M4.5S, PT0.000000001S
         """
-        import re
-        match = re.match(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$', duration_string)
-        if not match:
+        if duration_string[:1] != 'P':
             raise ValueError(f"Invalid ISO duration format: {duration_string}")
         
-        days, hours, minutes, seconds = match.groups()
-        
+        # Walk the components by hand: each number is followed by its
+        # designator, designators appear in D, T, H, M, S order, and only the
+        # seconds may carry a fraction, which is kept as exact integer nanos
+        length = len(duration_string)
+        pos = 1
+        last = -1
         total_nanos = 0
         
-        if days:
-            total_nanos += int(days) * 86400 * 1_000_000_000
-        if hours:
-            total_nanos += int(hours) * 3600 * 1_000_000_000
-        if minutes:
-            total_nanos += int(minutes) * 60 * 1_000_000_000
-        if seconds:
-            sec = float(seconds)
-            total_nanos += int(sec * 1_000_000_000)
+        while pos < length:
+            if duration_string[pos] == 'T' and last < 1:
+                last = 1
+                pos += 1
+                continue
+            
+            start = pos
+            while pos < length and duration_string[pos].isdecimal():
+                pos += 1
+            number = duration_string[start:pos]
+            
+            fraction = ''
+            if duration_string[pos:pos + 1] == '.':
+                pos += 1
+                start = pos
+                while pos < length and duration_string[pos].isdecimal():
+                    pos += 1
+                fraction = duration_string[start:pos]
+                if not fraction:
+                    raise ValueError(f"Invalid ISO duration format: {duration_string}")
+            
+            designator = duration_string[pos:pos + 1]
+            index = 'DTHMS'.find(designator) if designator else -1
+            if (not number or index <= last or index == 1 or (index > 1) != (last >= 1) or
+                    (fraction and designator != 'S')):
+                raise ValueError(f"Invalid ISO duration format: {duration_string}")
+            last = index
+            pos += 1
+            
+            if designator == 'D':
+                total_nanos += int(number) * _NS_PER_DAY
+            elif designator == 'H':
+                total_nanos += int(number) * _NS_PER_HOUR
+            elif designator == 'M':
+                total_nanos += int(number) * _NS_PER_MIN
+            else:
+                total_nanos += int(number) * _NS_PER_SEC
+                if fraction:
+                    # Pad or truncate to 9 digits (nanoseconds)
+                    total_nanos += int(fraction.ljust(9, '0')[:9])
         
         return cls(total_nanos)
     
     def to_iso8601(self) -> str:
         """Convert to ISO 8601 duration string."""
+        # Instances are treated as immutable, so the string is formatted once
+        if self._iso is None:
+            self._iso = self._format_iso8601()
+        return self._iso
+    
+    def _format_iso8601(self) -> str:
+        """Format the ISO 8601 string returned by to_iso8601."""
         if self.nanoseconds == 0:
             return 'PT0S'
         
-        remaining = abs(self.nanoseconds)  # Work with absolute value
-        result = 'P'
+        negative = self.nanoseconds < 0
+        remaining = -self.nanoseconds if negative else self.nanoseconds
+        result = '-P' if negative else 'P'
         
         # Days
-        days = remaining // (86400 * 1_000_000_000)
-        if days > 0:
+        if remaining >= _NS_PER_DAY:
+            days, remaining = divmod(remaining, _NS_PER_DAY)
             result += f'{days}D'
-            remaining = remaining % (86400 * 1_000_000_000)
         
-        if remaining > 0:
+        if remaining:
             result += 'T'
             
             # Hours
-            hours = remaining // (3600 * 1_000_000_000)
-            if hours > 0:
+            if remaining >= _NS_PER_HOUR:
+                hours, remaining = divmod(remaining, _NS_PER_HOUR)
                 result += f'{hours}H'
-                remaining = remaining % (3600 * 1_000_000_000)
             
             # Minutes
-            minutes = remaining // (60 * 1_000_000_000)
-            if minutes > 0:
+            if remaining >= _NS_PER_MIN:
+                minutes, remaining = divmod(remaining, _NS_PER_MIN)
                 result += f'{minutes}M'
-                remaining = remaining % (60 * 1_000_000_000)
             
             # Seconds (with fractional part)
-            if remaining > 0:
-                seconds = remaining // 1_000_000_000
-                nanos_part = remaining % 1_000_000_000
-                
+            if remaining:
+                seconds, nanos_part = divmod(remaining, _NS_PER_SEC)
                 if nanos_part == 0:
                     result += f'{seconds}S'
                 else:
                     fractional_str = str(nanos_part).zfill(9).rstrip('0')
                     result += f'{seconds}.{fractional_str}S'
         
-        # Handle negative durations
-        if self.nanoseconds < 0:
-            result = '-' + result
-        
         return result
     
     def total_nanos(self) -> int:
@@ -401,19 +581,19 @@ class Duration:
     
     def total_seconds(self) -> float:
         """Get total seconds."""
-        return self.nanoseconds / 1_000_000_000
+        return self.nanoseconds / _NS_PER_SEC
     
     def total_minutes(self) -> float:
         """Get total minutes."""
-        return self.nanoseconds / (60 * 1_000_000_000)
+        return self.nanoseconds / _NS_PER_MIN
     
     def total_hours(self) -> float:
         """Get total hours."""
-        return self.nanoseconds / (3600 * 1_000_000_000)
+        return self.nanoseconds / _NS_PER_HOUR
     
     def total_days(self) -> float:
         """Get total days."""
-        return self.nanoseconds / (86400 * 1_000_000_000)
+        return self.nanoseconds / _NS_PER_DAY
     
     def __str__(self) -> str:
         """Return ISO 8601 string representation."""
@@ -466,10 +646,18 @@ class Duration:
         return Duration(abs(self.nanoseconds))
 
 
+@functools.lru_cache(maxsize=256)
+def _offset_timezone(minutes: int) -> timezone:
+    """Return the fixed-offset timezone for a UTC offset in minutes."""
+    return timezone(timedelta(minutes=minutes))
+
+
 # Legacy Date class for backward compatibility
 class Date:
     """DEPRECATED: Use Instant instead. Legacy Date type with timezone offset support."""
     
+    __slots__ = ('utc', 'tz_offset')
+    
     def __init__(self, dt: Union[datetime, str], tz_offset: Optional[int] = None):
         """Initialize Date from datetime or ISO string.
         
@@ -477,19 +665,24 @@ class Date:
             dt: datetime object or ISO 8601 string
             tz_offset: timezone offset in minutes (e.g., -480 for PST)
         """
-        import warnings
         warnings.warn("Date class is deprecated. Use Instant instead.", DeprecationWarning, stacklevel=2)
         
         if isinstance(dt, str):
             # Parse ISO 8601 string
-            if dt.endswith('Z'):
+            if (dt[-1:] == 'Z' and dt[10:11] == 'T' and dt[13:14] == ':' and dt[16:17] == ':'
+                    and (len(dt) == 20 or dt[19:20] == '.' and dt[20:-1].isdecimal() and dt.isascii())):
+                # Zulu form with optional fraction: have fromisoformat attach
+                # UTC itself, which is far cheaper than datetime.replace(tzinfo=...)
+                self.utc = datetime.fromisoformat(dt[:-1] + '+00:00')
+                self.tz_offset = None
+            elif dt.endswith('Z'):
                 self.utc = datetime.fromisoformat(dt[:-1]).replace(tzinfo=timezone.utc)
                 self.tz_offset = None
             elif '+' in dt or dt.count('-') > 2:  # Has timezone
                 # Parse with timezone
-                self.utc = datetime.fromisoformat(dt).astimezone(timezone.utc)
-                # Calculate offset in minutes
                 local_dt = datetime.fromisoformat(dt)
+                self.utc = local_dt.astimezone(timezone.utc)
+                # Calculate offset in minutes
                 offset = local_dt.utcoffset()
                 if offset:
                     self.tz_offset = int(offset.total_seconds() / 60)
@@ -521,13 +714,11 @@ class Date:
     def to_iso8601(self) -> str:
         """Convert to ISO 8601 string."""
         if self.tz_offset is None:
-            # UTC - use Z suffix
-            return self.utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+            # UTC - use Z suffix in place of isoformat's +00:00
+            return self.utc.isoformat(timespec='seconds')[:-6] + 'Z'
         else:
             # Convert to timezone with offset
-            offset_seconds = self.tz_offset * 60
-            tz = timezone(timedelta(seconds=offset_seconds))
-            local_dt = self.utc.astimezone(tz)
+            local_dt = self.utc.astimezone(_offset_timezone(self.tz_offset))
             return local_dt.isoformat()
     
     def __str__(self) -> str:
@@ -554,28 +745,53 @@ def uuid_v4() -> uuid.UUID:
     return uuid.uuid4()
 
 
+def _reserve_uuid_v7_sequence(count: int) -> int:
+    """Reserve count consecutive UUID v7 sequence values and return the first."""
+    global _uuid_v7_last_sequence
+    now_ms = time.time_ns() // 1_000_000
+    
+    with _uuid_v7_lock:
+        if now_ms > _uuid_v7_last_sequence >> 12:
+            # New millisecond: seed the counter with 11 random bits, leaving
+            # headroom for increments
+            first = (now_ms << 12) | secrets.randbits(11)
+        else:
+            # Same millisecond (or the clock stepped back): keep counting,
+            # carrying into the timestamp when the counter runs out
+            first = _uuid_v7_last_sequence + 1
+        if count > 0:
+            _uuid_v7_last_sequence = first + count - 1
+    return first
+
+
 def uuid_v7() -> uuid.UUID:
-    """Generate a UUID v7 (timestamp-based)."""
-    # Get current timestamp in milliseconds
-    now_ms = int(time.time() * 1000)
-    
-    # Create bytes array
-    uuid_bytes = bytearray(16)
-    
-    # Set timestamp (48 bits)
-    uuid_bytes[0] = (now_ms >> 40) & 0xff
-    uuid_bytes[1] = (now_ms >> 32) & 0xff
-    uuid_bytes[2] = (now_ms >> 24) & 0xff
-    uuid_bytes[3] = (now_ms >> 16) & 0xff
-    uuid_bytes[4] = (now_ms >> 8) & 0xff
-    uuid_bytes[5] = now_ms & 0xff
-    
-    # Set random bits
-    random_bytes = secrets.token_bytes(10)
-    uuid_bytes[6:] = random_bytes
-    
-    # Set version (7) and variant bits
-    uuid_bytes[6] = (uuid_bytes[6] & 0x0f) | 0x70  # Version 7
-    uuid_bytes[8] = (uuid_bytes[8] & 0x3f) | 0x80  # Variant 10
-    
-    return uuid.UUID(bytes=bytes(uuid_bytes))
\ No newline at end of file
+    """Generate a UUID v7 (timestamp-based).
+    
+    Values are monotonic within the process: the 12 bits after the version
+    hold a counter that starts at a random point in each millisecond and
+    steps by one per UUID, carrying into the timestamp if it runs out.
+    """
+    sequence = _reserve_uuid_v7_sequence(1)
+    random_bits = int.from_bytes(secrets.token_bytes(8), 'big')
+    
+    # Timestamp (48 bits), version 7, counter, variant 10, then 62 random bits
+    return uuid.UUID(int=((sequence >> 12) << 80) | ((sequence & 0xfff) << 64)
+                     | _UUID_V7_VERSION_VARIANT | (random_bits & _UUID_V7_RAND_B_BITS))
+
+
+def uuid_v7_batch(count: int) -> List[uuid.UUID]:
+    """Generate count UUID v7s with one clock read and one random read.
+    
+    The batch reserves a run of consecutive counter values from the same
+    state as uuid_v7(), so it is in order and sorts after every UUID
+    generated before it. Each UUID is assembled as a 128-bit integer from its
+    timestamp and counter, the version and variant bits and eight bytes of
+    the shared random buffer.
+    """
+    first = _reserve_uuid_v7_sequence(count)
+    random_bytes = secrets.token_bytes(8 * count)
+    
+    from_bytes = int.from_bytes
+    return [uuid.UUID(int=((sequence >> 12) << 80) | ((sequence & 0xfff) << 64) | _UUID_V7_VERSION_VARIANT
+                      | (from_bytes(random_bytes[i:i + 8], 'big') & _UUID_V7_RAND_B_BITS))
+            for i, sequence in zip(range(0, 8 * count, 8), range(first, first + count))]
\ No newline at end of file
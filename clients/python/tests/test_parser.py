@@ -2,7 +2,8 @@
 
 import pytest
 import uuid
-from kjson import loads, JSONDecodeError, BigInt, Decimal128, Date
+from kjson import loads, loads_many, JSONDecodeError, BigInt, Decimal128, Date
+from kjson import parser as parser_module
 
 
 class TestBasicTypes:
@@ -40,6 +41,10 @@ class TestBasicTypes:
         
         # Unicode escapes
         assert loads(r'"\u0048\u0065\u006c\u006c\u006f"') == "Hello"
+        
+        # Surrogate pairs combine into one character; lone surrogates are kept
+        assert loads(r'"\ud83d\ude00"') == "\U0001f600"
+        assert loads(r'"\ud83d x"') == "\ud83d x"
     
     def test_array(self):
         """Test parsing arrays."""
@@ -92,12 +97,24 @@ class TestExtendedTypes:
         assert isinstance(result, Decimal128)
         assert str(result) == "-99.99"
     
+    def test_parsed_extended_numbers_independent(self):
+        """Test that changing a parsed BigInt or Decimal128 leaves later parses alone."""
+        big, price = loads("[42n, 19.99m]")
+        big.value = 7
+        price.digits = "1"
+        assert loads("[42n, 19.99m]") == [BigInt(42), Decimal128("19.99")]
+    
     def test_uuid(self):
         """Test parsing UUID values."""
         uuid_str = "550e8400-e29b-41d4-a716-446655440000"
         result = loads(uuid_str)
         assert isinstance(result, uuid.UUID)
         assert str(result) == uuid_str
+        
+        # Upper-case hex digits; other spellings uuid.UUID accepts are not kJSON
+        assert loads(uuid_str.upper()) == uuid.UUID(uuid_str)
+        with pytest.raises(JSONDecodeError):
+            loads("urn:uuid:" + uuid_str)
     
     def test_date(self):
         """Test parsing Date values."""
@@ -124,6 +141,14 @@ class TestJSON5Features:
         result = loads('{name: "test", "value": 42}')
         assert result == {"name": "test", "value": 42}
     
+    def test_keyword_like_values(self):
+        """Test keys and values that start like true/false or a UUID."""
+        result = loads("{true: false, fade: true, f: [false, true]}")
+        assert result == {"true": False, "fade": True, "f": [False, True]}
+        
+        result = loads("[f81d4fae-7dec-11d0-a765-00a0c91e6bf6, false]")
+        assert result == [uuid.UUID("f81d4fae-7dec-11d0-a765-00a0c91e6bf6"), False]
+    
     def test_trailing_commas(self):
         """Test trailing commas in arrays and objects."""
         assert loads("[1, 2, 3,]") == [1, 2, 3]
@@ -158,6 +183,9 @@ class TestJSON5Features:
         }
         """)
         assert result == {"name": "test", "value": 42}
+        
+        # Stars inside and around block comments
+        assert loads("/** doc * with / stars **/ [1, /*/ 2 */ 3 /***/]") == [1, 3]
 
 
 class TestComplexStructures:
@@ -288,6 +316,45 @@ class TestEdgeCases:
         # Nested objects
         result = loads('{"outer": {"type": "special"}}', object_hook=hook)
         assert result == {"outer": "SPECIAL_OBJECT"}
+    
+    def test_object_hook_in_arrays(self):
+        """Test object hook on objects nested inside arrays."""
+        seen = []
+        
+        def hook(obj):
+            seen.append(sorted(obj))
+            return obj.get("name", obj)
+        
+        result = loads('[{"name": "a"}, [{"name": "b"}], {"inner": {"name": "c"}}]', object_hook=hook)
+        assert result == ["a", ["b"], {"inner": "c"}]
+        
+        # Inner objects are hooked before the objects containing them
+        assert seen.index(["name"]) < seen.index(["inner"])
+    
+    def test_loads_many(self):
+        """Test parsing a batch of documents."""
+        lines = ['{id: 1, big: 10n}', '[1, 2, 3]', "'text'", 'null']
+        assert loads_many(lines) == [loads(line) for line in lines]
+        assert loads_many(iter([])) == []
+        
+        # Options apply to every document
+        result = loads_many(['{a: 1}', '[{a: 2}]'], object_hook=lambda obj: obj["a"])
+        assert result == [1, [2]]
+    
+    def test_repeated_keys_shared(self):
+        """Test that repeated object keys reuse one string object."""
+        first, second = loads_many(['[{"name": 1}]', "{name: 2, 'other': 3}"])
+        assert next(iter(first[0])) is next(iter(second))
+        
+        # Long keys are left out of the cache
+        long_key = "k" * 100
+        loads(f'{{"{long_key}": 1}}')
+        assert long_key not in parser_module._KEY_CACHE
+    
+    def test_key_cache_bounded(self):
+        """Test that the key cache stays within its size limit."""
+        loads_many([f'{{"key{i}": {i}}}' for i in range(parser_module._KEY_CACHE_SIZE + 10)])
+        assert len(parser_module._KEY_CACHE) <= parser_module._KEY_CACHE_SIZE
 
 
 class TestBacktickStrings:
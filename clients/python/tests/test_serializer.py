@@ -3,7 +3,8 @@
 import pytest
 import uuid
 from datetime import datetime, timezone
-from kjson import dumps, loads, BigInt, Decimal128, Date, JSONEncoder
+from kjson import dumps, loads, dumpb, loadb, BigInt, Decimal128, Date, Instant, Duration, JSONEncoder, JSONDecodeError
+from kjson.serializer import _KEY_PREFIX_CACHE, _KEY_PREFIX_CACHE_SIZE
 
 
 class TestBasicSerialization:
@@ -84,6 +85,17 @@ class TestExtendedTypes:
         
         # In array
         assert dumps([d]) == "[2025-01-10T12:00:00Z]"
+    
+    def test_instant_and_duration(self):
+        """Test serializing Instant and Duration as their nanosecond objects."""
+        data = {"at": Instant(1736510400123456789), "took": Duration(1_500_000_000)}
+        result = dumps(data)
+        assert result == "{at: {nanoseconds: 1736510400123456789}, took: {nanoseconds: 1500000000}}"
+        assert "".join(JSONEncoder().iterencode(data)) == result
+        
+        parsed = loads(result)
+        assert Instant(**parsed["at"]) == data["at"]
+        assert Duration(**parsed["took"]) == data["took"]
 
 
 class TestFormatting:
@@ -109,6 +121,17 @@ class TestFormatting:
         result = dumps(data, indent=4)
         assert "    " in result  # 4 spaces
     
+    def test_pretty_print_deep_nesting(self):
+        """Test indentation stays correct for deeply nested values."""
+        data = 1
+        for _ in range(100):
+            data = [data]
+        
+        lines = dumps(data, indent=2).split('\n')
+        assert lines[100] == ' ' * 200 + '1'
+        assert lines[-2] == '  ]'
+        assert lines[-1] == ']'
+    
     def test_sort_keys(self):
         """Test key sorting."""
         data = {"z": 1, "a": 2, "m": 3}
@@ -132,6 +155,17 @@ class TestFormatting:
         data = {"message": "Hello 世界"}
         result = dumps(data, ensure_ascii=True)
         assert r"\u4e16\u754c" in result
+        
+        # Control, Latin-1 and astral characters use \uXXXX escapes too
+        assert dumps("\x01\x7f\xe9", ensure_ascii=True) == r"'\u0001\u007f\u00e9'"
+        assert dumps("\U0001f600", ensure_ascii=True) == r"'\ud83d\ude00'"
+        assert loads(dumps("\U0001f600", ensure_ascii=True)) == "\U0001f600"
+        assert loads(dumps("caf\xe9 \\ \x01", ensure_ascii=True)) == "caf\xe9 \\ \x01"
+        
+        # Any truthy or falsy flag works, as with the json module
+        assert dumps(["Hello 世界"], ensure_ascii=2) == r"['Hello \u4e16\u754c']"
+        assert dumps(["Hello 世界"], ensure_ascii=None) == "['Hello 世界']"
+        assert JSONEncoder(ensure_ascii=None).encode("Hello 世界") == "'Hello 世界'"
 
 
 class TestRoundTrip:
@@ -186,6 +220,24 @@ class TestRoundTrip:
         kjson_str = dumps(data)
         parsed = loads(kjson_str)
         assert parsed == data
+    
+    def test_bytes(self):
+        """Test round-trip through the bytes API."""
+        data = {"name": "Hello 世界", "big": BigInt(10 ** 30), "items": [1, 2, 3]}
+        
+        encoded = dumpb(data, sort_keys=True)
+        assert isinstance(encoded, bytes)
+        assert encoded == dumps(data, sort_keys=True).encode('utf-8')
+        
+        assert loadb(encoded) == data
+        assert loadb(bytearray(encoded)) == data
+        assert loadb(memoryview(encoded)) == data
+        
+        # Invalid UTF-8 is reported as a decode error at the offending character
+        with pytest.raises(JSONDecodeError) as exc_info:
+            loadb(b'{"name": "caf\xc3\xa9 \xff"}')
+        assert exc_info.value.msg == "Invalid UTF-8"
+        assert exc_info.value.pos == 15
 
 
 class TestEncoderClass:
@@ -211,6 +263,31 @@ class TestEncoderClass:
         result = list(encoder.iterencode({"a": 1}))
         assert len(result) == 1
         assert result[0] == "{a: 1}"
+    
+    def test_iterencode_chunks(self):
+        """Test iterencode streams large documents in several chunks."""
+        data = {"items": [{"id": i, "name": f"item {i}", "tags": ["a", "b"]} for i in range(5000)]}
+        
+        for encoder in (JSONEncoder(), JSONEncoder(indent=2, sort_keys=True)):
+            chunks = list(encoder.iterencode(data))
+            assert len(chunks) > 1
+            assert "".join(chunks) == encoder.encode(data)
+    
+    def test_options_changed_after_init(self):
+        """Test that encoders use options changed after construction."""
+        encoder = JSONEncoder()
+        encoder.indent = 2
+        encoder.sort_keys = True
+        expected = "{\n  a: [\n    1\n  ],\n  b: 1\n}"
+        assert encoder.encode({"b": 1, "a": [1]}) == expected
+        assert "".join(encoder.iterencode({"b": 1, "a": [1]})) == expected
+        
+        class SortingEncoder(JSONEncoder):
+            def __init__(self, **kw):
+                super().__init__(**kw)
+                self.sort_keys = True
+        
+        assert dumps({"b": 1, "a": 2}, cls=SortingEncoder) == "{a: 2, b: 1}"
 
 
 class TestSpecialCases:
@@ -250,11 +327,31 @@ class TestSpecialCases:
         result = dumps({"custom": obj}, default=default)
         parsed = loads(result)
         assert parsed == {"custom": {"_type": "custom", "value": 42}}
+        
+        # Values returned by default are converted too
+        nested = CustomType(CustomType(7))
+        assert loads(dumps([nested], default=default)) == [
+            {"_type": "custom", "value": {"_type": "custom", "value": 7}}
+        ]
     
     def test_tuple_serialization(self):
         """Test that tuples are serialized as arrays."""
         assert dumps((1, 2, 3)) == "[1, 2, 3]"
         assert dumps({"tuple": (4, 5, 6)}) == "{tuple: [4, 5, 6]}"
+    
+    def test_key_prefix_cache_bounded(self):
+        """Test that large objects and long keys skip the key prefix cache."""
+        _KEY_PREFIX_CACHE.clear()
+        wide = {f"k{i}": i for i in range(100)}
+        long_keys = {"a" * 2000: 1}
+        assert loads(dumps(wide)) == wide
+        assert loads(dumps(long_keys)) == long_keys
+        assert dumps({"a": 1}) == "{a: 1}"
+        assert list(_KEY_PREFIX_CACHE) == [(False, ("a",))]
+        
+        for i in range(_KEY_PREFIX_CACHE_SIZE + 10):
+            dumps({f"k{i}": i})
+        assert len(_KEY_PREFIX_CACHE) <= _KEY_PREFIX_CACHE_SIZE
 
 
 class TestSmartQuoteSelection:
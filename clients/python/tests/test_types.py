@@ -1,8 +1,12 @@
 """Test kJSON extended types."""
 
+import copy
+import pickle
+import time
+import uuid
 import pytest
 from datetime import datetime, timezone, timedelta
-from kjson import BigInt, Decimal128, Date, uuid_v4, uuid_v7
+from kjson import BigInt, Decimal128, Instant, Duration, Date, uuid_v4, uuid_v7, uuid_v7_batch
 
 
 class TestBigInt:
@@ -29,6 +33,14 @@ class TestBigInt:
         assert str(bi) == "-123456789012345678901234567890"
         assert bi.to_kjson_string() == "-123456789012345678901234567890n"
     
+    def test_value_change(self):
+        """Test that changing the value updates the string forms."""
+        bi = BigInt(123)
+        assert str(bi) == "123"
+        bi.value = 456
+        assert str(bi) == "456"
+        assert bi.to_kjson_string() == "456n"
+    
     def test_equality(self):
         """Test BigInt equality."""
         bi1 = BigInt(123)
@@ -92,6 +104,121 @@ class TestDecimal128:
         assert d1 != 99.99  # Not equal to regular float
 
 
+class TestInstant:
+    """Test Instant type."""
+    
+    def test_from_iso8601(self):
+        """Test parsing ISO 8601 timestamps."""
+        assert Instant.from_iso8601("1970-01-01T00:00:00Z").nanoseconds == 0
+        assert Instant.from_iso8601("2025-01-10T12:00:00Z").epoch_seconds() == 1736510400
+        
+        instant = Instant.from_iso8601("2025-01-10T12:00:00.123456789Z")
+        assert instant.nanoseconds == 1736510400123456789
+        
+        # Offsets are converted to Zulu time
+        assert Instant.from_iso8601("2025-01-10T04:00:00-08:00") == Instant.from_iso8601("2025-01-10T12:00:00Z")
+    
+    def test_from_iso8601_batch(self):
+        """Test parsing a batch of ISO 8601 timestamps."""
+        strings = [
+            "2025-01-10T12:00:00.123456789Z",
+            "2025-01-10T23:59:59Z",
+            "2025-01-11T00:00:00.5Z",
+            "2025-01-10T07:00:00-05:00",
+        ]
+        instants = Instant.from_iso8601_batch(strings)
+        assert instants == [Instant.from_iso8601(s) for s in strings]
+        assert Instant.from_iso8601_batch([]) == []
+        
+        with pytest.raises(ValueError):
+            Instant.from_iso8601_batch(["2025-01-10T12:00:00Z", "2025-02-30T12:00:00Z"])
+    
+    def test_invalid_iso8601(self):
+        """Test rejecting malformed timestamps."""
+        with pytest.raises(ValueError):
+            Instant.from_iso8601("2025-01-10 12:00")
+        with pytest.raises(ValueError):
+            Instant.from_iso8601("2025-02-29T00:00:00Z")
+        with pytest.raises(ValueError):
+            Instant.from_iso8601("2025-01-10T24:00:00Z")
+    
+    def test_to_iso8601(self):
+        """Test formatting ISO 8601 timestamps."""
+        assert Instant(0).to_iso8601() == "1970-01-01T00:00:00Z"
+        assert Instant(1736510400120000000).to_iso8601() == "2025-01-10T12:00:00.12Z"
+        assert Instant(1736510400000000001).to_iso8601() == "2025-01-10T12:00:00.000000001Z"
+        assert Instant(-1).to_iso8601() == "1969-12-31T23:59:59.999999999Z"
+        assert Instant(951782400000000000).to_iso8601() == "2000-02-29T00:00:00Z"
+        assert Instant(-62135596800000000000).to_iso8601() == "0001-01-01T00:00:00Z"
+        
+        # The formatted string is computed once and reused
+        instant = Instant(1736510400000000001)
+        assert instant.to_iso8601() is instant.to_iso8601()
+        assert str(instant) is instant.to_iso8601()
+        
+        # Changing the value drops the cached string
+        instant.nanoseconds = 0
+        assert instant.to_iso8601() == "1970-01-01T00:00:00Z"
+    
+    def test_round_trip(self):
+        """Test that formatting and parsing preserve nanoseconds."""
+        for nanos in (0, 1, 999_999_999, 1736510400123456789, 4102444799999999999):
+            assert Instant.from_iso8601(Instant(nanos).to_iso8601()).nanoseconds == nanos
+    
+    def test_now(self):
+        """Test that the current instant has nanosecond resolution."""
+        before = time.time_ns()
+        instant = Instant.now()
+        after = time.time_ns()
+        assert isinstance(instant.nanoseconds, int)
+        assert before <= instant.nanoseconds <= after
+    
+    def test_instances_independent(self):
+        """Test that changing one Instant leaves equal Instants alone."""
+        instant = Instant(5)
+        instant.nanoseconds = 9
+        assert Instant(5).nanoseconds == 5
+        assert pickle.loads(pickle.dumps(instant)) == instant
+        assert copy.deepcopy(instant) == instant
+    
+    def test_ordering(self):
+        """Test Instant comparisons."""
+        assert Instant(1) < Instant(2) <= Instant(2)
+        assert Instant(3) > Instant(2) >= Instant(2)
+
+
+class TestDuration:
+    """Test Duration type."""
+    
+    def test_from_iso8601(self):
+        """Test parsing ISO 8601 durations."""
+        assert Duration.from_iso8601("PT1H2M3S") == Duration.from_seconds(3723)
+        assert Duration.from_iso8601("P1DT2H3M4.5S").nanoseconds == 93784_500_000_000
+        assert Duration.from_iso8601("PT0.000000001S").nanoseconds == 1
+        assert Duration.from_iso8601("P2D") == Duration.from_days(2)
+        # Fractional seconds stay exact far beyond float precision
+        assert Duration.from_iso8601("PT123456789.123456789S").nanoseconds == 123456789_123456789
+    
+    def test_invalid_iso8601(self):
+        """Test rejecting malformed durations."""
+        for text in ("1H", "PT1X", "P1H", "PT1M1H", "P1.5D", "PT1.S"):
+            with pytest.raises(ValueError):
+                Duration.from_iso8601(text)
+    
+    def test_to_iso8601(self):
+        """Test formatting ISO 8601 durations."""
+        assert Duration(0).to_iso8601() == "PT0S"
+        assert Duration.from_hours(25).to_iso8601() == "P1DT1H"
+        assert Duration(1_500_000_000).to_iso8601() == "PT1.5S"
+        assert (-Duration.from_minutes(90)).to_iso8601() == "-PT1H30M"
+        
+        # Changing the value drops the cached string
+        duration = Duration(1_500_000_000)
+        duration.to_iso8601()
+        duration.nanoseconds = 0
+        assert duration.to_iso8601() == "PT0S"
+
+
 class TestDate:
     """Test Date type."""
     
@@ -117,6 +244,10 @@ class TestDate:
         date = Date("2025-01-10T12:00:00Z")
         assert date.to_iso8601() == "2025-01-10T12:00:00Z"
         assert date.tz_offset is None
+        
+        # Fractional seconds are dropped and years stay four digits wide
+        assert Date("2025-01-10T12:00:00.5Z").to_iso8601() == "2025-01-10T12:00:00Z"
+        assert Date("0999-01-10T12:00:00Z").to_iso8601() == "0999-01-10T12:00:00Z"
     
     def test_from_string_with_offset(self):
         """Test creating Date from ISO string with offset."""
@@ -175,4 +306,45 @@ class TestUUIDGeneration:
         ts1 = int.from_bytes(u1.bytes[:6], 'big')
         ts2 = int.from_bytes(u2.bytes[:6], 'big')
         
-        assert ts2 >= ts1  # Later UUID should have same or higher timestamp
\ No newline at end of file
+        assert ts2 >= ts1  # Later UUID should have same or higher timestamp
+    
+    def test_uuid_v7_monotonic(self, monkeypatch):
+        """Test that UUID v7 values keep increasing within a millisecond."""
+        batch = [uuid_v7() for _ in range(1000)]
+        assert batch == sorted(batch)
+        assert len(set(batch)) == 1000
+        
+        # With the clock frozen the counter runs out and carries into the timestamp
+        frozen_ms = int.from_bytes(batch[-1].bytes[:6], 'big') + 10
+        monkeypatch.setattr(time, "time_ns", lambda: frozen_ms * 1_000_000)
+        batch = [uuid_v7() for _ in range(5000)]
+        assert batch == sorted(batch)
+        assert int.from_bytes(batch[0].bytes[:6], 'big') == frozen_ms
+        assert int.from_bytes(batch[-1].bytes[:6], 'big') == frozen_ms + 1
+        assert all(u.version == 7 and u.variant == uuid.RFC_4122 for u in batch)
+    
+    def test_uuid_v7_batch(self):
+        """Test generating UUID v7 values in bulk."""
+        before = time.time_ns() // 1_000_000
+        batch = uuid_v7_batch(100)
+        
+        assert len(batch) == 100
+        assert len(set(batch)) == 100
+        for u in batch:
+            assert u.version == 7
+            assert u.variant == uuid.RFC_4122
+            assert before <= int.from_bytes(u.bytes[:6], 'big')
+        assert uuid_v7_batch(0) == []
+    
+    def test_uuid_v7_batch_ordering(self, monkeypatch):
+        """Test that UUID v7 batches sort between the UUIDs around them."""
+        generated = [uuid_v7()] + uuid_v7_batch(100) + [uuid_v7()] + uuid_v7_batch(100)
+        assert generated == sorted(generated)
+        assert len(set(generated)) == 202
+        
+        # Within one millisecond a batch continues the counter of uuid_v7()
+        frozen_ms = int.from_bytes(generated[-1].bytes[:6], 'big') + 10
+        monkeypatch.setattr(time, "time_ns", lambda: frozen_ms * 1_000_000)
+        generated = [uuid_v7()] + uuid_v7_batch(5000) + [uuid_v7()]
+        assert generated == sorted(generated)
+        assert int.from_bytes(generated[-1].bytes[:6], 'big') == frozen_ms + 1
\ No newline at end of file